@@ -5,7 +5,9 @@ Provides cross-platform hardware monitoring capabilities with multiple fallback
 """
 
 import os
+import importlib
 import threading
+import time
 import platform
 import subprocess
 from typing import Optional, Tuple
@@ -15,27 +17,23 @@ import psutil
 # Platform detection
 IS_WINDOWS = platform.system() == "Windows"
 
-if IS_WINDOWS:
-    # Windows specific imports
-    CREATE_NO_WINDOW = 0x08000000  # subprocess.CREATE_NO_WINDOW
-    try:
-        import wmi
-    except ImportError:
-        wmi = None
-    try:
-        import pythoncom  # pywin32
-    except ImportError:
-        pythoncom = None
-else:
-    CREATE_NO_WINDOW = 0
-    wmi = None
-    pythoncom = None
-
-# Try to import GPUtil
-try:
-    import GPUtil
-except ImportError:
-    GPUtil = None
+# subprocess.CREATE_NO_WINDOW on Windows
+CREATE_NO_WINDOW = 0x08000000 if IS_WINDOWS else 0
+
+# Optional modules (wmi, pythoncom, GPUtil) are imported on first use, which
+# keeps their import cost out of window creation and on the monitor's worker
+_optional_modules = {}
+
+
+def _optional_import(name: str):
+    """Import an optional module once; None if it is not installed."""
+    if name not in _optional_modules:
+        try:
+            _optional_modules[name] = importlib.import_module(name)
+        except ImportError:
+            _optional_modules[name] = None
+    return _optional_modules[name]
+
 
 # WMI CoInitialize state tracking per thread
 _wmi_thread_local = threading.local()
@@ -44,9 +42,19 @@ _wmi_thread_local = threading.local()
 class HardwareMonitor:
     """Hardware monitoring utilities for CPU and GPU."""
 
+    # Set once nvidia-smi turns out to be missing, so it is not spawned again
+    _nvidia_smi_missing = False
+
+    # Last nvidia-smi result as (monotonic time, (usage, temperature))
+    NVIDIA_CACHE_TTL = 1.5  # seconds
+    _nvidia_cache = (float('-inf'), (None, None))
+    _nvidia_lock = threading.Lock()
+
     @staticmethod
     def get_cpu_temperature() -> Optional[float]:
         """Advanced CPU temperature reading with prioritized strategies."""
+        wmi = _optional_import('wmi') if IS_WINDOWS else None
+        pythoncom = _optional_import('pythoncom') if IS_WINDOWS else None  # pywin32
         
         # Priority 1: OpenHardwareMonitor WMI (Best if running)
         if IS_WINDOWS and wmi:
@@ -194,12 +202,27 @@ class HardwareMonitor:
     def get_nvidia_gpu_info() -> Tuple[Optional[float], Optional[float]]:
         """Get NVIDIA GPU usage and temperature using nvidia-smi (hidden console window).
 
+        Results are reused for NVIDIA_CACHE_TTL seconds, so callers polling at
+        the same time share one nvidia-smi run.
+
         Returns:
             Tuple of (usage_percent, temperature_celsius) or (None, None) if unavailable
         """
-        if not IS_WINDOWS:
+        if not IS_WINDOWS or HardwareMonitor._nvidia_smi_missing:
             return None, None  # Currently Windows-focused; other platforms use GPUtil
-            
+
+        with HardwareMonitor._nvidia_lock:
+            cached_at, value = HardwareMonitor._nvidia_cache
+            now = time.monotonic()
+            if now - cached_at < HardwareMonitor.NVIDIA_CACHE_TTL:
+                return value
+            value = HardwareMonitor._query_nvidia_smi()
+            HardwareMonitor._nvidia_cache = (now, value)
+            return value
+
+    @staticmethod
+    def _query_nvidia_smi() -> Tuple[Optional[float], Optional[float]]:
+        """Run nvidia-smi once and parse usage and temperature."""
         try:
             # Quick check if nvidia-smi exists
             cmd = ['nvidia-smi', '--query-gpu=utilization.gpu,temperature.gpu', '--format=csv,noheader,nounits']
@@ -226,7 +249,10 @@ class HardwareMonitor:
             util = float(util_str)
             temp = float(temp_str)
             return util, temp
-            
+
+        except FileNotFoundError:
+            HardwareMonitor._nvidia_smi_missing = True
+            return None, None
         except Exception:
             return None, None
 
@@ -237,6 +263,7 @@ class HardwareMonitor:
         Returns:
             Tuple of (usage_display, temperature_display)
         """
+        GPUtil = _optional_import('GPUtil')
         if not GPUtil:
             return "GPUtil library not installed.", "pip install gputil"
             
@@ -62,6 +62,7 @@ LANGUAGE_DICT = {
         # CPU Stress Test
         'stress_test_title': 'CPU Stress Test',
         'core_count': 'Number of Cores to Use:',
+        'reproducible_mode': 'Reproducible mode (no fast-math)',
         'start_test': 'Start Test',
         'stop_test': 'Stop Test',
         'status_waiting': 'Status: Waiting',
@@ -181,6 +182,8 @@ LANGUAGE_DICT = {
         'duplicate_title': 'Duplicate',
         'duplicate_exists': "A webhook named '{0}' already exists. Select it to edit or use New for another.",
         'threshold_number_error': 'Threshold must be a number.',
+        'validation_invalid_url': 'URL must be a valid http(s) address.',
+        'validation_name_too_long': 'Name must be at most {0} characters.',
         'duplicate_rename_error': "Another webhook named '{0}' already exists.",
         'test_title': 'Test',
         'test_select_warning': 'Select at least one webhook.',
@@ -405,6 +408,7 @@ LANGUAGE_DICT = {
         # CPU Stress Test
         'stress_test_title': 'CPU Stres Testi',
         'core_count': 'Kullanılacak Çekirdek Sayısı:',
+        'reproducible_mode': 'Tekrarlanabilir mod (fast-math kapalı)',
         'start_test': 'Testi Başlat',
         'stop_test': 'Testi Durdur',
         'status_waiting': 'Durum: Beklemede',
@@ -524,6 +528,8 @@ LANGUAGE_DICT = {
         'duplicate_title': 'Kopya',
         'duplicate_exists': "'{0}' adlı webhook zaten var. Düzenlemek için seçin veya yeni bir ad kullanın.",
         'threshold_number_error': 'Eşik bir sayı olmalıdır.',
+        'validation_invalid_url': 'URL geçerli bir http(s) adresi olmalıdır.',
+        'validation_name_too_long': 'Ad en fazla {0} karakter olmalıdır.',
         'duplicate_rename_error': "'{0}' adlı başka bir webhook mevcut.",
         'test_title': 'Test',
         'test_select_warning': 'En az bir webhook seçin.',
@@ -707,20 +713,29 @@ class LanguageManager:
         self.current_language = 'en'  # Default to English
         self.config_file = 'language_config.json'
         self.load_language_preference()
+        # Translation table of the active language, rebound on set_language
+        self._active_table = LANGUAGE_DICT.get(self.current_language, LANGUAGE_DICT['en'])
+        self._is_en = self.current_language == 'en'
         
     def get_text(self, key: str) -> str:
         """Get translated text for the specified key."""
-        return LANGUAGE_DICT[self.current_language].get(key, key)
+        return self._active_table.get(key, key)
     
     def set_language(self, language: str):
         """Change language."""
         if language in LANGUAGE_DICT:
             self.current_language = language
+            self._active_table = LANGUAGE_DICT[language]
+            self._is_en = language == 'en'
             self.save_language_preference()
     
     def get_current_language(self) -> str:
         """Get current language."""
         return self.current_language
+
+    def is_english(self) -> bool:
+        """Check whether English is the current language."""
+        return self._is_en
     
     def save_language_preference(self):
         """Save language preference to file."""
@@ -169,6 +169,12 @@ class WebhookNotifier:
         self.webhook_config = webhook_config
         self.last_network_status = True
         self.cpu_alert_sent = {}  # Last CPU alert sending times
+        # One keep-alive session for all sends, so repeated posts to the same
+        # host skip the TCP/TLS handshake; sized for the parallel test sends
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=8, pool_maxsize=16)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
 
     def send_teams_message(self, webhook_url: str, title: str, message: str, color: str = "FF0000"):
         """Send message to Teams."""
@@ -186,7 +192,7 @@ class WebhookNotifier:
                 }]
             }
 
-            response = requests.post(webhook_url, json=payload, timeout=10)
+            response = self.session.post(webhook_url, json=payload, timeout=10)
             return response.status_code == 200
 
         except Exception as e:
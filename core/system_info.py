@@ -6,8 +6,11 @@ as well as monitor top consuming processes.
 """
 
 import time
+import heapq
+import threading
 import psutil
-from typing import List, Dict, Tuple
+from operator import itemgetter
+from typing import List, Dict, Tuple, Optional
 
 
 class SystemInfo:
@@ -210,124 +213,220 @@ class SystemInfo:
         except Exception:
             return 0, 0, 0
 
+    @staticmethod
+    def get_cpu_times():
+        """Get a system-wide CPU times sample for get_cpu_usage_between()."""
+        return psutil.cpu_times()
 
-class ProcessMonitor:
-    """Process monitoring class."""
-
-    def __init__(self, top_count: int = 3):
-        self.top_count = top_count
+    @staticmethod
+    def get_cpu_usage_between(start, end) -> float:
+        """Get CPU usage percentage between two get_cpu_times() samples.
+
+        Unlike psutil.cpu_percent(None) this keeps no module-level state, so it
+        does not disturb other windows sampling the CPU at their own pace.
+        """
+        def totals(times):
+            total = sum(times)
+            # guest time is already counted in user/nice on Linux
+            total -= getattr(times, 'guest', 0) + getattr(times, 'guest_nice', 0)
+            busy = total - times.idle - getattr(times, 'iowait', 0)
+            return total, busy
+
+        total_start, busy_start = totals(start)
+        total_end, busy_end = totals(end)
+        total_delta = total_end - total_start
+        if total_delta <= 0:
+            return 0.0
+        return max(0.0, min(100.0, (busy_end - busy_start) / total_delta * 100))
 
-    def set_top_count(self, count: int):
-        """Set the number of top consuming applications to track."""
-        self.top_count = count
+    @staticmethod
+    def get_network_counters():
+        """Get raw network I/O counters for get_network_usage_between()."""
+        return psutil.net_io_counters()
 
-    def get_top_cpu_processes(self) -> List[Dict]:
-        """Get top CPU consuming processes."""
-        processes = []
+    @staticmethod
+    def get_network_usage_between(start, end, elapsed: float) -> Tuple[float, float, float]:
+        """Get per-second network usage (sent, recv, total) between two counter samples."""
+        if start is None or end is None or elapsed <= 0:
+            return 0, 0, 0
+        bytes_sent = (end.bytes_sent - start.bytes_sent) / elapsed
+        bytes_recv = (end.bytes_recv - start.bytes_recv) / elapsed
+        return bytes_sent, bytes_recv, bytes_sent + bytes_recv
 
+    @staticmethod
+    def get_usable_cpus() -> List[int]:
+        """Get the logical CPU ids this process may run on (empty if unsupported)."""
         try:
-            process_list = []
-            # Get all processes
-            for proc in psutil.process_iter(['pid', 'name', 'memory_info']):
-                try:
-                    process_list.append(proc)
-                except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-                    continue
+            return list(psutil.Process().cpu_affinity())
+        except (AttributeError, psutil.Error, OSError):
+            # cpu_affinity() does not exist on macOS
+            return []
 
-            # First CPU measurement
-            cpu_measurements = {}
-            for proc in process_list:
-                try:
-                    cpu_measurements[proc.pid] = proc.cpu_percent()
-                except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-                    continue
+    @staticmethod
+    def set_cpu_affinity(cpu_id: int) -> bool:
+        """Pin the calling process to a single logical CPU.
 
-            # Wait for accurate measurement
-            time.sleep(1.0)
+        Returns False where affinity is unsupported (macOS) or not permitted.
+        """
+        try:
+            psutil.Process().cpu_affinity([cpu_id])
+            return True
+        except (AttributeError, psutil.Error, OSError, ValueError):
+            return False
 
-            # Second CPU measurement
-            for proc in process_list:
-                try:
-                    cpu_usage = proc.cpu_percent()
-
-                    # Filter low CPU usage and system processes
-                    if (cpu_usage is not None and cpu_usage > 0.1 and
-                            proc.info['name'].lower() not in ['system idle process', 'system', '[system process]']):
-                        cpu_display = cpu_usage / 10
-
-                        processes.append({
-                            'name': proc.info['name'],
-                            'cpu': cpu_display,
-                            'memory': proc.info['memory_info'].rss / 1024 / 1024,  # MB
-                            'pid': proc.info['pid']
-                        })
-                except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-                    continue
 
-        except Exception as e:
-            print(f"Error getting CPU process list: {str(e)}")
+class ProcessMonitor:
+    """Process monitoring class."""
 
-        # Sort by CPU usage and return specified count
-        processes.sort(key=lambda x: x['cpu'], reverse=True)
-        return processes[:self.top_count]
+    # Field positions in a snapshot row: (name, cpu, memory_mb, network_score, connections, pid)
+    NAME, CPU, MEMORY, NETWORK_SCORE, CONNECTIONS, PID = range(6)
 
-    def get_top_network_processes(self) -> List[Dict]:
-        """Get top network consuming processes."""
-        network_processes = []
+    SYSTEM_PROCESS_NAMES = ('system idle process', 'system', '[system process]')
 
-        for proc in psutil.process_iter(['pid', 'name']):
-            try:
-                proc_info = proc.info
-                connections = proc.net_connections()
+    def __init__(self, top_count: int = 3):
+        self.top_count = top_count
+        # Process objects kept between scans, so cpu_percent() measures since the previous scan
+        self._processes: Dict[int, psutil.Process] = {}
 
-                if connections:
-                    connection_count = len(connections)
-                    established_connections = len([c for c in connections if c.status == 'ESTABLISHED'])
+    def set_top_count(self, count: int):
+        """Set the number of top consuming applications to track."""
+        self.top_count = count
 
-                    # Calculate network usage score
-                    network_score = established_connections * 10 + connection_count
+    def _scan(self) -> List[Tuple]:
+        """List running processes as (fresh, tracked) pairs and refresh the tracked set.
+
+        fresh carries this scan's cached info, tracked is the object seen by the
+        previous scan (or fresh for new processes) and holds the CPU baseline.
+        """
+        previous = self._processes
+        current = {}
+        pairs = []
+        for proc in psutil.process_iter(['pid', 'name', 'memory_info']):
+            tracked = previous.get(proc.pid)
+            if tracked is None or tracked != proc:  # New process or reused pid
+                tracked = proc
+            current[proc.pid] = tracked
+            pairs.append((proc, tracked))
+        self._processes = current
+        return pairs
+
+    def prime(self):
+        """Start a per-process CPU measurement that the next snapshot() completes."""
+        try:
+            pairs = self._scan()
+        except Exception as e:
+            print(f"Error getting process list: {str(e)}")
+            return
+        for _, tracked in pairs:
+            try:
+                tracked.cpu_percent()
+            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                continue
+
+    def snapshot(self, include_cpu: bool = True, include_network: bool = True,
+                 stop_event: Optional[threading.Event] = None) -> List[Tuple]:
+        """Sample all processes in a single pass.
+
+        Per-process CPU is measured since the previous prime() or snapshot().
+        Without one, the processes are primed here and sampled after a second.
+
+        Args:
+            include_cpu: Measure per-process CPU
+            include_network: Count per-process connections
+            stop_event: Optional event that aborts the one-second priming wait
+
+        Returns:
+            List of (name, cpu, memory_mb, network_score, connections, pid) tuples.
+            cpu is None when not measured; network fields are 0 when not counted.
+        """
+        if include_cpu and not self._processes:
+            self.prime()
+            if stop_event is not None:
+                if stop_event.wait(1.0):
+                    return []
+            else:
+                time.sleep(1.0)
 
-                    if network_score > 0:
-                        network_processes.append({
-                            'name': proc_info['name'],
-                            'network_score': network_score,
-                            'connections': established_connections,
-                            'pid': proc_info['pid']
-                        })
+        try:
+            process_list = self._scan()
+        except Exception as e:
+            print(f"Error getting process list: {str(e)}")
+            return []
 
+        rows = []
+        for proc, tracked in process_list:
+            try:
+                info = proc.info
+                mem_info = info['memory_info']
+                memory_mb = mem_info.rss / 1024 / 1024 if mem_info else 0.0  # MB
+
+                # CPU since the previous scan (0.0 for processes that just appeared)
+                cpu_usage = tracked.cpu_percent() if include_cpu else None
+
+                network_score = 0
+                established_connections = 0
+                if include_network:
+                    try:
+                        connections = proc.net_connections()
+                    except (psutil.AccessDenied, psutil.ZombieProcess):
+                        connections = []
+                    if connections:
+                        established_connections = len([c for c in connections if c.status == 'ESTABLISHED'])
+                        # Calculate network usage score
+                        network_score = established_connections * 10 + len(connections)
+
+                rows.append((info['name'] or '', cpu_usage, memory_mb,
+                             network_score, established_connections, info['pid']))
             except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-                pass
+                continue
+
+        return rows
+
+    def top_cpu(self, snapshot: List[Tuple], count: int = None) -> List[Dict]:
+        """Get top CPU consuming processes from a snapshot."""
+        # Filter low CPU usage and system processes
+        candidates = (row for row in snapshot
+                      if row[self.CPU] is not None and row[self.CPU] > 0.1 and
+                      row[self.NAME].lower() not in self.SYSTEM_PROCESS_NAMES)
+
+        # Partial selection of the top entries instead of a full sort
+        top_rows = heapq.nlargest(count or self.top_count, candidates, key=itemgetter(self.CPU))
+        return [{
+            'name': row[self.NAME],
+            'cpu': row[self.CPU] / 10,
+            'memory': row[self.MEMORY],
+            'pid': row[self.PID]
+        } for row in top_rows]
+
+    def top_memory(self, snapshot: List[Tuple], count: int = None) -> List[Dict]:
+        """Get top memory consuming processes from a snapshot."""
+        candidates = (row for row in snapshot if row[self.MEMORY] > 10)  # Filter very small processes
+        top_rows = heapq.nlargest(count or self.top_count, candidates, key=itemgetter(self.MEMORY))
+        return [{
+            'name': row[self.NAME],
+            'memory': row[self.MEMORY],
+            'pid': row[self.PID]
+        } for row in top_rows]
+
+    def top_network(self, snapshot: List[Tuple], count: int = None) -> List[Dict]:
+        """Get top network consuming processes from a snapshot."""
+        candidates = (row for row in snapshot if row[self.NETWORK_SCORE] > 0)
+        top_rows = heapq.nlargest(count or self.top_count, candidates, key=itemgetter(self.NETWORK_SCORE))
+        return [{
+            'name': row[self.NAME],
+            'network_score': row[self.NETWORK_SCORE],
+            'connections': row[self.CONNECTIONS],
+            'pid': row[self.PID]
+        } for row in top_rows]
 
-        # Sort by network score and return specified count
-        network_processes.sort(key=lambda x: x['network_score'], reverse=True)
-        return network_processes[:self.top_count]
+    def get_top_cpu_processes(self) -> List[Dict]:
+        """Get top CPU consuming processes."""
+        return self.top_cpu(self.snapshot(include_cpu=True, include_network=False))
+
+    def get_top_network_processes(self) -> List[Dict]:
+        """Get top network consuming processes."""
+        return self.top_network(self.snapshot(include_cpu=False, include_network=True))
 
     def get_top_memory_processes(self) -> List[Dict]:
         """Get top memory consuming processes."""
-        processes = []
-
-        try:
-            # Get all processes
-            for proc in psutil.process_iter(['pid', 'name', 'memory_info']):
-                try:
-                    mem_info = proc.info['memory_info']
-                    if mem_info:
-                        memory_mb = mem_info.rss / 1024 / 1024  # Convert to MB
-                        
-                        # Filter system processes if needed, similar to CPU
-                        if memory_mb > 10: # Filter very small processes
-                             processes.append({
-                                'name': proc.info['name'],
-                                'memory': memory_mb,
-                                'pid': proc.info['pid']
-                            })
-
-                except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-                    continue
-
-        except Exception as e:
-            print(f"Error getting memory process list: {str(e)}")
-
-        # Sort by memory usage and return specified count
-        processes.sort(key=lambda x: x['memory'], reverse=True)
-        return processes[:self.top_count]
+        return self.top_memory(self.snapshot(include_cpu=False, include_network=False))
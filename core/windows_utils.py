@@ -1,5 +1,8 @@
 import subprocess
 import os
+import io
+import codecs
+import locale
 import shutil
 import platform
 
@@ -136,28 +139,46 @@ class WindowsUtils:
             print(f"Error writing {scope} PATH: {e}")
             return False
 
+    # Bytes per stdout read in run_command_live
+    LIVE_READ_CHUNK = 4096
+
     @staticmethod
     def run_command_live(command: str, output_callback):
         """
         Run a shell command and stream output to a callback function.
         Blocking call - should be run in a thread.
+
+        stdout is delivered in chunks of whatever the pipe holds (up to
+        LIVE_READ_CHUNK bytes), not line by line, so a chatty command costs
+        one callback per read instead of one per line.
         """
         try:
             process = subprocess.Popen(
                 command,
                 shell=True,
                 stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                errors='replace'  # Handle decoding errors gracefully
+                stderr=subprocess.PIPE
             )
             
-            # Read stdout
-            for line in process.stdout:
-                output_callback(line)
+            # Read stdout; read1 returns as soon as any data is available, and
+            # the decoder copes with characters or \r\n split across reads
+            decoder = io.IncrementalNewlineDecoder(
+                codecs.getincrementaldecoder(locale.getpreferredencoding(False))(errors='replace'),
+                translate=True
+            )
+            while True:
+                data = process.stdout.read1(WindowsUtils.LIVE_READ_CHUNK)
+                if not data:
+                    break
+                text = decoder.decode(data)
+                if text:
+                    output_callback(text)
+            text = decoder.decode(b'', final=True)
+            if text:
+                output_callback(text)
             
             # Read stderr
-            for line in process.stderr:
+            for line in io.TextIOWrapper(process.stderr, errors='replace'):
                 output_callback(f"[Error] {line}")
                 
             process.wait()
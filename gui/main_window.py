@@ -3,26 +3,38 @@ Main System Monitor GUI for ResourceChecker application.
 """
 
 import time
-import threading
+import queue
+import asyncio
 import platform
+import threading
 import tkinter as tk
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from tkinter import ttk, scrolledtext
 
 from core.language import language_manager
 from core.system_info import SystemInfo, ProcessMonitor
 from core.network import NetworkHealthChecker, WebhookConfig, WebhookNotifier
 from utils.logging import Logger, NetworkLogger, AutoLogger, FileManager
-from gui.resource_monitor_window import ResourceTempMonitorWindow
-from gui.stress_test_window import CPUStressTestWindow
-from gui.webhook_settings_window import WebhookSettingsWindow
-from gui.network_settings_window import NetworkSettingsWindow
-from gui.system_info_window import SystemSpecsWindow
-from gui.wifi_window import WifiWindow
+from gui.styles import configure_styles
+
+# Secondary windows are imported lazily in their open_* methods
+WINDOWS_TOOLS_AVAILABLE = platform.system() == 'Windows'
+
+
+# One monitoring tick, produced in the executor and applied on the Tk thread
+Sample = namedtuple('Sample', [
+    'monitor_cpu', 'monitor_ram', 'monitor_network',
+    'cpu_percent', 'memory', 'net_sent', 'net_recv', 'net_total',
+    'top_cpu', 'top_ram', 'top_network',
+])
 
-if platform.system() == 'Windows':
-    from gui.windows_tools_window import WindowsToolsWindow
-else:
-    WindowsToolsWindow = None
+# Precompiled %-templates for per-tick label and log text
+_CPU_FMT = "CPU Usage: %.1f%%"
+_RAM_FMT = "RAM Usage: %.1f%%"
+_NET_FMT = "Network: ↑%.1f KB/s ↓%.1f KB/s"
+_CPU_LOG_FMT = "CPU: %.1f%%"
+_RAM_LOG_FMT = "RAM: %.1f%%"
 
 
 class SystemMonitorGUI:
@@ -36,6 +48,12 @@ class SystemMonitorGUI:
         # Main components
         self.monitoring = False
         self.network_monitoring = False
+        # Button text keys indexed by the current on/off state
+        self._monitor_btn_keys = ('start_monitoring', 'stop_monitoring')
+        self._net_btn_keys = ('auto_network_monitoring', 'stop_auto_network')
+        # Language button text and toggle target, indexed by language_manager.is_english()
+        self._lang_btn_keys = ('language_turkish', 'language_english')
+        self._lang_toggle_targets = ('en', 'tr')
         self.system_interval = 60
         self.network_interval = 300
         self.top_apps_count = 3
@@ -48,6 +66,13 @@ class SystemMonitorGUI:
         self.wifi_window = None
         self.windows_tools_window = None
 
+        # Language the UI texts were last rendered in
+        self._cached_lang = language_manager.get_current_language()
+
+        # Pending debounced UI callbacks
+        self._top_apps_after_id = None
+        self._language_after_id = None
+
         # Monitoring Priority Variables
         self.monitor_cpu_var = tk.BooleanVar(value=True)
         self.monitor_ram_var = tk.BooleanVar(value=True)
@@ -67,12 +92,79 @@ class SystemMonitorGUI:
         
         self.logger = Logger(self.log_text)
         self.network_logger = NetworkLogger(self.network_log_text)
-        self.auto_logger = AutoLogger(self.log_text, self.network_log_text)
+        self.auto_logger = AutoLogger(self.log_text, self.network_log_text, self.post_to_gui)
         self.webhook_notifier = WebhookNotifier(self.webhook_config)
         self._last_network_check_ts = 0.0
 
+        # Callbacks posted by worker threads, run on the Tk thread by _tick_asyncio
+        self._gui_queue = queue.Queue()
+
+        # Asyncio loop driven from the Tk event loop (monitoring coroutines)
+        self.loop = asyncio.new_event_loop()
+        # Blocking work (sampling, health checks) shares two fixed worker threads
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='rc-mon')
+        self.loop.set_default_executor(self._executor)
+        self._monitor_task = None
+        self._network_task = None
+        # (monotonic time, CPU times, network counters) at the start of the current sample
+        self._sample_window = None
+        self._health_check_task = None
+        self._health_check_lock = asyncio.Lock()
+        # Set on stop so in-flight sampling waits in the executor return immediately
+        self._stop_event = threading.Event()
+        self.root.after(50, self._tick_asyncio)
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+
+    def _on_close(self):
+        """Stop background work and close the main window."""
+        self.monitoring = False
+        self.network_monitoring = False
+        self._stop_event.set()
+        # Its pool workers are non-daemon processes and would keep the interpreter alive
+        if self.stress_test_window is not None:
+            self.stress_test_window.on_close()
+        tasks = asyncio.all_tasks(self.loop)
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            # Let the cancelled tasks unwind so none is destroyed while pending
+            self.loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self.loop.close()
+        self.root.destroy()
+
+    def _tick_asyncio(self):
+        """Run ready asyncio callbacks and queued GUI callbacks, then reschedule on the Tk loop."""
+        try:
+            self.loop.call_soon(self.loop.stop)
+            self.loop.run_forever()
+            self._drain_gui_queue()
+        finally:
+            # Poll quickly only while coroutines are alive; back off when idle
+            delay = 50 if asyncio.all_tasks(self.loop) else 250
+            self.root.after(delay, self._tick_asyncio)
+
+    def _drain_gui_queue(self):
+        """Run all callbacks posted from worker threads."""
+        try:
+            while True:
+                callback, args = self._gui_queue.get_nowait()
+                try:
+                    callback(*args)
+                except Exception as e:
+                    print(f"GUI callback error: {e}")
+        except queue.Empty:
+            pass
+
+    def post_to_gui(self, callback, *args):
+        """Schedule callback(*args) on the Tk thread. Safe to call from any thread."""
+        self._gui_queue.put((callback, args))
+
     def setup_gui(self):
         """Setup main GUI interface."""
+        # Register named styles once for all windows
+        self.style = configure_styles(self.root)
+
         main_frame = ttk.Frame(self.root, padding="10")
         main_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
 
@@ -120,12 +212,9 @@ class SystemMonitorGUI:
         self.language_label = ttk.Label(self.settings_frame, text="Dil / Language:")
         self.language_label.grid(row=1, column=3, sticky=tk.W, pady=(10, 0), padx=(10, 5))
         
-        current_lang = language_manager.get_current_language()
-        button_text = language_manager.get_text('language_english') if current_lang == 'en' else language_manager.get_text('language_turkish')
-        
         self.language_button = ttk.Button(
             self.settings_frame, 
-            text=button_text,
+            text=language_manager.get_text(self._lang_btn_keys[language_manager.is_english()]),
             command=self._toggle_language,
             width=10
         )
@@ -175,7 +264,7 @@ class SystemMonitorGUI:
         self.wifi_btn = ttk.Button(button_frame, text="Wi-Fi", command=self.open_wifi_analyzer)
         self.wifi_btn.pack(side=tk.LEFT, padx=(10, 0))
         
-        if WindowsToolsWindow is not None:
+        if WINDOWS_TOOLS_AVAILABLE:
             self.win_tools_btn = ttk.Button(button_frame, text="Windows Tools", command=self.open_windows_tools)
             self.win_tools_btn.pack(side=tk.LEFT, padx=(10, 0))
         else:
@@ -186,15 +275,22 @@ class SystemMonitorGUI:
         self.info_frame = ttk.LabelFrame(parent, text=language_manager.get_text('system_info_frame'), padding="10")
         self.info_frame.grid(row=2, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=(0, 10))
 
-        self.cpu_label = ttk.Label(self.info_frame, text=language_manager.get_text('cpu_usage'))
+        # Labels are bound to StringVars so per-tick updates are a plain variable set
+        self.cpu_var = tk.StringVar(value=language_manager.get_text('cpu_usage'))
+        self.cpu_label = ttk.Label(self.info_frame, textvariable=self.cpu_var)
         self.cpu_label.grid(row=0, column=0, sticky=tk.W)
 
-        self.memory_label = ttk.Label(self.info_frame, text=language_manager.get_text('ram_usage'))
+        self.memory_var = tk.StringVar(value=language_manager.get_text('ram_usage'))
+        self.memory_label = ttk.Label(self.info_frame, textvariable=self.memory_var)
         self.memory_label.grid(row=1, column=0, sticky=tk.W)
 
-        self.network_label = ttk.Label(self.info_frame, text=language_manager.get_text('network_status'))
+        self.network_var = tk.StringVar(value=language_manager.get_text('network_status'))
+        self.network_label = ttk.Label(self.info_frame, textvariable=self.network_var)
         self.network_label.grid(row=2, column=0, sticky=tk.W)
 
+        # True while a label still shows its translated "--" placeholder
+        self._info_defaults_cpu = self._info_defaults_mem = self._info_defaults_net = True
+
     def _setup_processes_frame(self, parent):
         """Setup process tables."""
         processes_container = ttk.Frame(parent)
@@ -230,6 +326,11 @@ class SystemMonitorGUI:
             self.ram_tree.column(col, width=120, anchor='center')
         self.ram_tree.grid(row=0, column=0, sticky=(tk.W, tk.E))
 
+        # Row ids per tree, reused across refreshes
+        self._cpu_row_ids = []
+        self._network_row_ids = []
+        self._ram_row_ids = []
+
     def _setup_log_frames(self, parent):
         """Setup log areas."""
         log_container = ttk.Frame(parent)
@@ -245,7 +346,8 @@ class SystemMonitorGUI:
         self.export_system_btn = ttk.Button(system_log_buttons, text=language_manager.get_text('export_system_logs'), command=self.export_system_logs)
         self.export_system_btn.pack(side=tk.LEFT)
         
-        self.log_text = scrolledtext.ScrolledText(self.system_log_frame, height=12, width=50)
+        self.log_text = scrolledtext.ScrolledText(self.system_log_frame, height=12, width=50,
+                                                  undo=False, maxundo=0, autoseparators=False, state='disabled')
         self.log_text.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
 
         self.network_log_frame = ttk.LabelFrame(log_container, text=language_manager.get_text('network_logs'), padding="10")
@@ -258,7 +360,8 @@ class SystemMonitorGUI:
         self.export_network_btn = ttk.Button(network_log_buttons, text=language_manager.get_text('export_network_logs'), command=self.export_network_logs)
         self.export_network_btn.pack(side=tk.LEFT)
         
-        self.network_log_text = scrolledtext.ScrolledText(self.network_log_frame, height=12, width=50)
+        self.network_log_text = scrolledtext.ScrolledText(self.network_log_frame, height=12, width=50,
+                                                          undo=False, maxundo=0, autoseparators=False, state='disabled')
         self.network_log_text.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
 
         # Grid configuration
@@ -278,7 +381,14 @@ class SystemMonitorGUI:
         main_frame.rowconfigure(4, weight=1)
 
     def _on_top_apps_changed(self, event):
-        """Handle top apps count change."""
+        """Handle top apps count change (debounced)."""
+        if self._top_apps_after_id is not None:
+            self.root.after_cancel(self._top_apps_after_id)
+        self._top_apps_after_id = self.root.after(100, self._apply_top_apps_change)
+
+    def _apply_top_apps_change(self):
+        """Apply the selected top apps count."""
+        self._top_apps_after_id = None
         try:
             new_count = int(self.top_apps_var.get())
             self.top_apps_count = new_count
@@ -305,142 +415,189 @@ class SystemMonitorGUI:
                 self.system_interval = 60
 
             self.monitoring = True
-            self.toggle_monitoring_btn.config(text=language_manager.get_text('stop_monitoring'))
+            self._stop_event.clear()
+            self.toggle_monitoring_btn.config(text=language_manager.get_text(self._monitor_btn_keys[self.monitoring]))
             
-            self.monitor_thread = threading.Thread(target=self._monitor_system_worker, daemon=True)
-            self.monitor_thread.start()
+            self._monitor_task = self.loop.create_task(self._monitor_system())
             self.logger.log(language_manager.get_text('monitoring_started').format(self.system_interval))
 
     def stop_monitoring(self):
         """Stop monitoring."""
         self.monitoring = False
-        self.toggle_monitoring_btn.config(text=language_manager.get_text('start_monitoring'))
+        self._stop_event.set()
+        if self._monitor_task is not None:
+            self._monitor_task.cancel()
+            self._monitor_task = None
+        self.toggle_monitoring_btn.config(text=language_manager.get_text(self._monitor_btn_keys[self.monitoring]))
         self.logger.log(language_manager.get_text('monitoring_stopped'))
 
-    def _monitor_system_worker(self):
-        """System monitoring worker thread."""
+    async def _monitor_system(self):
+        """System monitoring coroutine (sampling runs in the executor)."""
+        # Each sample covers the time since the previous one; the first covers one second
+        try:
+            await self.loop.run_in_executor(None, self._open_sample_window)
+            await asyncio.sleep(1.0)
+        except Exception as e:
+            self.logger.log(f"Error: {str(e)}", "error")
         while self.monitoring:
             try:
-                # Initialize variables
-                cpu_percent = 0
-                memory = None
-                net_sent, net_recv, net_total = 0, 0, 0
-                top_cpu_processes = []
-                top_ram_processes = []
-                top_network_processes = []
-                
-                # Fetch data based on selection
-                if self.monitor_cpu_var.get():
-                    cpu_percent = SystemInfo.get_cpu_usage()
-                    top_cpu_processes = self.process_monitor.get_top_cpu_processes()
-                
-                if self.monitor_ram_var.get():
-                    memory = SystemInfo.get_memory_info()
-                    top_ram_processes = self.process_monitor.get_top_memory_processes()
-                else: 
-                     # Get basic memory info even if not monitoring apps, for the main label
-                    memory = SystemInfo.get_memory_info()
-
-                if self.monitor_network_var.get():
-                    net_sent, net_recv, net_total = SystemInfo.get_network_usage()
-                    top_network_processes = self.process_monitor.get_top_network_processes()
-                
-                # Update GUI
-                self.root.after(0, lambda: self._update_system_gui(cpu_percent, memory, net_sent, net_recv, net_total))
-                self.root.after(0, lambda: self._update_process_trees(top_cpu_processes, top_network_processes, top_ram_processes))
-                
-                if self.monitor_cpu_var.get():
-                    self.webhook_notifier.check_and_notify_cpu(cpu_percent)
-
-                # Construct Log Message
-                log_parts = []
-                if self.monitor_cpu_var.get():
-                    log_parts.append(f"CPU: {cpu_percent:.1f}%")
-                if self.monitor_ram_var.get() and memory:
-                    log_parts.append(f"RAM: {memory.percent:.1f}%")
-                if self.monitor_network_var.get():
-                    log_parts.append(f"Network: ↑{net_sent / 1024:.1f} KB/s ↓{net_recv / 1024:.1f} KB/s")
-                
-                if log_parts:
-                    log_msg = ", ".join(log_parts)
-                    self.root.after(0, lambda msg=log_msg: self.logger.log(msg))
-                
-                # Granular App Logging (if enabled and selected)
-                if log_parts: # Only log details if we are logging main stats
-                     # Log Top CPU Apps
-                    if self.monitor_cpu_var.get() and top_cpu_processes:
-                         header = language_manager.get_text('log_header_cpu')
-                         items = []
-                         for idx, proc in enumerate(top_cpu_processes, 1):
-                             item = language_manager.get_text('log_item_cpu').format(proc['name'], f"{proc['cpu']:.1f}")
-                             items.append(f"{idx}- {item}")
-                         
-                         full_msg = f"{header} " + " ".join(items)
-                         self.root.after(0, lambda m=full_msg: self.logger.log(m))
-
-                    # Log Top RAM Apps
-                    if self.monitor_ram_var.get() and top_ram_processes:
-                         header = language_manager.get_text('log_header_ram')
-                         items = []
-                         for idx, proc in enumerate(top_ram_processes, 1):
-                             item = language_manager.get_text('log_item_ram').format(proc['name'], f"{proc['memory']:.1f}")
-                             items.append(f"{idx}- {item}")
-                         
-                         full_msg = f"{header} " + " ".join(items)
-                         self.root.after(0, lambda m=full_msg: self.logger.log(m))
-
-                    # Log Top Network Apps
-                    if self.monitor_network_var.get() and top_network_processes:
-                         header = language_manager.get_text('log_header_net')
-                         items = []
-                         for idx, proc in enumerate(top_network_processes, 1):
-                             total_kb = (proc['network_score']) # Simplified for log
-                             item = language_manager.get_text('log_item_net').format(proc['name'], f"{total_kb:.1f}")
-                             items.append(f"{idx}- {item}")
-                         
-                         full_msg = f"{header} " + " ".join(items)
-                         self.root.after(0, lambda m=full_msg: self.logger.log(m))
-
-                time.sleep(self.system_interval)
+                # Tk variables are read here, on the main thread
+                flags = (self.monitor_cpu_var.get(), self.monitor_ram_var.get(), self.monitor_network_var.get())
+                sample = await self.loop.run_in_executor(None, self._gather_snapshot, *flags)
+                self._apply_tick_update(sample)
             except Exception as e:
-                self.root.after(0, lambda: self.logger.log(f"Error: {str(e)}", "error"))
-                time.sleep(self.system_interval)
+                self.logger.log(f"Error: {str(e)}", "error")
+            await asyncio.sleep(self.system_interval)
+
+    def _open_sample_window(self):
+        """Record the counters the first sample is measured against (executor)."""
+        self._sample_window = (time.monotonic(), SystemInfo.get_cpu_times(),
+                               SystemInfo.get_network_counters())
+        self.process_monitor.prime()
+
+    def _gather_snapshot(self, monitor_cpu, monitor_ram, monitor_network):
+        """Collect one monitoring sample. Runs off the Tk thread, no widget access."""
+        cpu_percent = 0
+        net_sent, net_recv, net_total = 0, 0, 0
+        top_cpu, top_ram, top_network = [], [], []
+
+        # Close the measurement window shared by system CPU, network and per-process CPU
+        # and open the next one at the same instant
+        window_start, cpu_times_start, net_start = self._sample_window
+        window_end = time.monotonic()
+        cpu_times_end = SystemInfo.get_cpu_times()
+        net_end = SystemInfo.get_network_counters()
+        self._sample_window = (window_end, cpu_times_end, net_end)
+
+        # One process scan shared by all three top-N tables
+        process_snapshot = []
+        if monitor_cpu or monitor_ram or monitor_network:
+            process_snapshot = self.process_monitor.snapshot(
+                include_cpu=monitor_cpu, include_network=monitor_network, stop_event=self._stop_event)
+
+        if monitor_cpu:
+            cpu_percent = SystemInfo.get_cpu_usage_between(cpu_times_start, cpu_times_end)
+            top_cpu = self.process_monitor.top_cpu(process_snapshot)
+
+        # Basic memory info is needed for the main label even if apps are not monitored
+        memory = SystemInfo.get_memory_info()
+        if monitor_ram:
+            top_ram = self.process_monitor.top_memory(process_snapshot)
+
+        if monitor_network:
+            net_sent, net_recv, net_total = SystemInfo.get_network_usage_between(
+                net_start, net_end, window_end - window_start)
+            top_network = self.process_monitor.top_network(process_snapshot)
+
+        # Webhook delivery is blocking network I/O, keep it off the Tk thread
+        if monitor_cpu:
+            self.webhook_notifier.check_and_notify_cpu(cpu_percent)
+
+        return Sample(monitor_cpu, monitor_ram, monitor_network, cpu_percent, memory,
+                      net_sent, net_recv, net_total, top_cpu, top_ram, top_network)
+
+    def _apply_tick_update(self, sample):
+        """Apply a monitoring sample to the GUI and logs (main thread)."""
+        cpu_percent = sample.cpu_percent
+        memory = sample.memory
+        net_sent, net_recv = sample.net_sent, sample.net_recv
+        top_cpu_processes = sample.top_cpu
+        top_ram_processes = sample.top_ram
+        top_network_processes = sample.top_network
+
+        # Update GUI
+        self._update_system_gui(cpu_percent, memory, net_sent, net_recv, sample.net_total)
+        self._update_process_trees(top_cpu_processes, top_network_processes, top_ram_processes)
+
+        # Construct Log Message
+        log_parts = []
+        if sample.monitor_cpu:
+            log_parts.append(_CPU_LOG_FMT % cpu_percent)
+        if sample.monitor_ram and memory:
+            log_parts.append(_RAM_LOG_FMT % memory.percent)
+        if sample.monitor_network:
+            log_parts.append(_NET_FMT % (net_sent / 1024, net_recv / 1024))
+
+        if not log_parts:
+            return
+        log_lines = [", ".join(log_parts)]
+
+        # Granular App Logging (only if we are logging main stats)
+        # Log Top CPU Apps
+        if sample.monitor_cpu and top_cpu_processes:
+            header = language_manager.get_text('log_header_cpu')
+            items = []
+            for idx, proc in enumerate(top_cpu_processes, 1):
+                item = language_manager.get_text('log_item_cpu').format(proc['name'], f"{proc['cpu']:.1f}")
+                items.append(f"{idx}- {item}")
+            log_lines.append(f"{header} " + " ".join(items))
+
+        # Log Top RAM Apps
+        if sample.monitor_ram and top_ram_processes:
+            header = language_manager.get_text('log_header_ram')
+            items = []
+            for idx, proc in enumerate(top_ram_processes, 1):
+                item = language_manager.get_text('log_item_ram').format(proc['name'], f"{proc['memory']:.1f}")
+                items.append(f"{idx}- {item}")
+            log_lines.append(f"{header} " + " ".join(items))
+
+        # Log Top Network Apps
+        if sample.monitor_network and top_network_processes:
+            header = language_manager.get_text('log_header_net')
+            items = []
+            for idx, proc in enumerate(top_network_processes, 1):
+                total_kb = (proc['network_score']) # Simplified for log
+                item = language_manager.get_text('log_item_net').format(proc['name'], f"{total_kb:.1f}")
+                items.append(f"{idx}- {item}")
+            log_lines.append(f"{header} " + " ".join(items))
+
+        # One widget insert for the whole tick
+        self.logger.log_many(log_lines)
 
     def _update_system_gui(self, cpu_percent, memory, net_sent, net_recv, net_total):
         """Update system GUI."""
         if self.monitor_cpu_var.get():
-            self.cpu_label.config(text=f"CPU Usage: {cpu_percent:.1f}%")
+            self.cpu_var.set(_CPU_FMT % cpu_percent)
+            self._info_defaults_cpu = False
         
         if memory: # Always update RAM label if we have info
-             self.memory_label.config(text=f"RAM Usage: {memory.percent:.1f}%")
+             self.memory_var.set(_RAM_FMT % memory.percent)
+             self._info_defaults_mem = False
         
         if self.monitor_network_var.get():
-            self.network_label.config(text=f"Network: ↑{net_sent / 1024:.1f} KB/s ↓{net_recv / 1024:.1f} KB/s")
+            self.network_var.set(_NET_FMT % (net_sent / 1024, net_recv / 1024))
+            self._info_defaults_net = False
 
     def _update_process_trees(self, cpu_processes, network_processes, ram_processes=None):
         """Update process tables."""
         
         # CPU Tree
-        for item in self.cpu_tree.get_children():
-            self.cpu_tree.delete(item)
-        if cpu_processes:
-             for proc in cpu_processes:
-                self.cpu_tree.insert('', 'end', values=(proc['name'], f"{proc['cpu']:.1f}%", f"{proc['memory']:.1f} MB"))
+        cpu_rows = [(proc['name'], f"{proc['cpu']:.1f}%", f"{proc['memory']:.1f} MB")
+                    for proc in cpu_processes or ()]
+        self._sync_tree_rows(self.cpu_tree, self._cpu_row_ids, cpu_rows)
 
         # Network Tree
-        for item in self.network_tree.get_children():
-            self.network_tree.delete(item)
-        if network_processes:
-            for proc in network_processes:
-                upload_kb, download_kb = proc['network_score'] * 0.3, proc['network_score'] * 0.7
-                self.network_tree.insert('', 'end', values=(proc['name'], f"{upload_kb:.1f}", f"{download_kb:.1f}", f"{(upload_kb + download_kb):.1f}", f"{proc['connections']} active"))
+        network_rows = []
+        for proc in network_processes or ():
+            upload_kb, download_kb = proc['network_score'] * 0.3, proc['network_score'] * 0.7
+            network_rows.append((proc['name'], f"{upload_kb:.1f}", f"{download_kb:.1f}", f"{(upload_kb + download_kb):.1f}", f"{proc['connections']} active"))
+        self._sync_tree_rows(self.network_tree, self._network_row_ids, network_rows)
         
         # RAM Tree (New)
         if ram_processes is not None:
-             for item in self.ram_tree.get_children():
-                self.ram_tree.delete(item)
-             for proc in ram_processes:
-                self.ram_tree.insert('', 'end', values=(proc['name'], f"{proc['memory']:.1f} MB"))
+            ram_rows = [(proc['name'], f"{proc['memory']:.1f} MB") for proc in ram_processes]
+            self._sync_tree_rows(self.ram_tree, self._ram_row_ids, ram_rows)
+
+    @staticmethod
+    def _sync_tree_rows(tree, row_ids, rows):
+        """Update existing rows in place; insert or delete only the difference."""
+        for iid, values in zip(row_ids, rows):
+            tree.item(iid, values=values)
+        for values in rows[len(row_ids):]:
+            row_ids.append(tree.insert('', 'end', values=values))
+        if len(row_ids) > len(rows):
+            tree.delete(*row_ids[len(rows):])
+            del row_ids[len(rows):]
 
     def toggle_auto_log(self):
         """Toggle auto log functionality."""
@@ -465,52 +622,78 @@ class SystemMonitorGUI:
                 self.network_interval = 300
 
             self.network_monitoring = True
-            self.network_auto_btn.config(text=language_manager.get_text('stop_auto_network'))
-            self.network_thread = threading.Thread(target=self._monitor_network_worker, daemon=True)
-            self.network_thread.start()
+            self.network_auto_btn.config(text=language_manager.get_text(self._net_btn_keys[self.network_monitoring]))
+            self._network_task = self.loop.create_task(self._monitor_network())
             self.network_logger.log(language_manager.get_text('network_monitoring_started').format(self.network_interval))
         else:
             self.network_monitoring = False
-            self.network_auto_btn.config(text=language_manager.get_text('auto_network_monitoring'))
+            if self._network_task is not None:
+                self._network_task.cancel()
+                self._network_task = None
+            self.network_auto_btn.config(text=language_manager.get_text(self._net_btn_keys[self.network_monitoring]))
             self.network_logger.log(language_manager.get_text('network_monitoring_stopped'))
 
-    def _monitor_network_worker(self):
-        """Network monitoring worker thread."""
+    async def _monitor_network(self):
+        """Network monitoring coroutine."""
         while self.network_monitoring:
-            self._network_health_check_internal(auto_mode=True)
-            time.sleep(self.network_interval)
+            await self._network_health_check_internal(auto_mode=True)
+            await asyncio.sleep(self.network_interval)
 
     def network_health_check(self):
         """Manual network health check."""
-        threading.Thread(target=self._network_health_check_internal, daemon=True).start()
+        # Repeated clicks while a check is still running are coalesced into it
+        if self._health_check_task is not None and not self._health_check_task.done():
+            return
+        self._health_check_task = self.loop.create_task(self._network_health_check_internal())
 
-    def _network_health_check_internal(self, auto_mode=False):
-        """Internal network health check."""
+    def _run_health_check(self):
+        """Blocking part of the health check (runs in the executor)."""
+        # Count the hosts up front so the summary matches the list that was checked
+        total_hosts = len(self.network_health_checker.test_hosts)
         results, successful_count = self.network_health_checker.check_health()
         network_ok = successful_count > 0
         self.webhook_notifier.check_and_notify_network(network_ok)
+        return results, successful_count, total_hosts
 
-        self.root.after(0, lambda: self.network_logger.log(language_manager.get_text('network_health_header')))
-        for result in results:
-            self.root.after(0, lambda r=result: self.network_logger.log(r))
+    async def _network_health_check_internal(self, auto_mode=False):
+        """Internal network health check."""
+        # One check at a time, whether started manually or by auto monitoring
+        async with self._health_check_lock:
+            results, successful_count, total_hosts = await self.loop.run_in_executor(None, self._run_health_check)
+
+        self.network_logger.log_many([language_manager.get_text('network_health_header')] + results)
         
         if successful_count == 0:
-            self.root.after(0, lambda: self.network_logger.log(language_manager.get_text('network_connection_error'), "error"))
-        elif successful_count == len(self.network_health_checker.test_hosts):
-            self.root.after(0, lambda: self.network_logger.log(language_manager.get_text('all_connections_ok'), "success"))
+            self.network_logger.log(language_manager.get_text('network_connection_error'), "error")
+        elif successful_count == total_hosts:
+            self.network_logger.log(language_manager.get_text('all_connections_ok'), "success")
+
+    def _track_window(self, attr, window):
+        """Store a child window in self.<attr> and reset it to None once destroyed."""
+        setattr(self, attr, window)
+
+        def _on_destroy(event):
+            # <Destroy> also fires for every child widget of the toplevel
+            if event.widget is window and getattr(self, attr) is window:
+                setattr(self, attr, None)
+
+        window.bind('<Destroy>', _on_destroy, add='+')
+        return window
 
     def open_resource_temp_monitor(self):
         """Open Resource & Temperature Monitor window."""
-        if self.temp_monitor_window is None or not self.temp_monitor_window.winfo_exists():
-            self.temp_monitor_window = ResourceTempMonitorWindow(self.root)
+        if self.temp_monitor_window is None:
+            from gui.resource_monitor_window import ResourceTempMonitorWindow
+            self._track_window('temp_monitor_window', ResourceTempMonitorWindow(self.root, self))
             self.logger.log(language_manager.get_text('resource_monitor_opened'))
         else:
             self.temp_monitor_window.lift()
 
     def open_cpu_stress_test(self):
         """Open CPU Stress Test window."""
-        if self.stress_test_window is None or not self.stress_test_window.winfo_exists():
-            self.stress_test_window = CPUStressTestWindow(self.root, self)
+        if self.stress_test_window is None:
+            from gui.stress_test_window import CPUStressTestWindow
+            self._track_window('stress_test_window', CPUStressTestWindow(self.root, self))
         else:
             self.stress_test_window.lift()
 
@@ -520,7 +703,7 @@ class SystemMonitorGUI:
 
     def export_system_logs(self):
         """Export system logs."""
-        content = self.log_text.get(1.0, 'end')
+        content = self.logger.get_content()
         FileManager.export_log_dialog(content, language_manager.get_text('export_system_logs'))
 
     def clear_network_logs(self):
@@ -529,145 +712,169 @@ class SystemMonitorGUI:
 
     def export_network_logs(self):
         """Export network logs."""
-        content = self.network_log_text.get(1.0, 'end')
+        content = self.network_logger.get_content()
         FileManager.export_log_dialog(content, language_manager.get_text('export_network_logs'))
 
     def _toggle_language(self):
         """Language toggle function."""
-        current_lang = language_manager.get_current_language()
-        new_lang = 'tr' if current_lang == 'en' else 'en'
-        language_manager.set_language(new_lang)
+        language_manager.set_language(self._lang_toggle_targets[language_manager.is_english()])
+
+        # Coalesce rapid toggles into a single UI refresh
+        if self._language_after_id is not None:
+            self.root.after_cancel(self._language_after_id)
+        self._language_after_id = self.root.after(100, self._apply_language_change)
+
+    def _apply_language_change(self):
+        """Refresh UI texts for the current language."""
+        self._language_after_id = None
+        lang = language_manager.get_current_language()
+        # Quick check: toggled back before the refresh ran, nothing to redraw
+        if lang == self._cached_lang:
+            return
         
         # Update all UI elements
-        self._update_all_texts()
+        self._update_all_texts(lang)
         # Açık network ayar penceresi varsa güncelle
-        if self.network_settings_window and self.network_settings_window.winfo_exists():
+        if self.network_settings_window is not None:
             self.network_settings_window.update_texts()
 
         # Log the language change
         if hasattr(self, 'logger'):
-            if new_lang == 'en':
+            if lang == 'en':
                 self.logger.log("Language changed to English")
             else:
                 self.logger.log("Dil Türkçe olarak değiştirildi")
 
-    def _update_all_texts(self):
+    def _update_all_texts(self, lang=None):
         """Update all text elements."""
+        # Query the language once for the whole refresh
+        if lang is None:
+            lang = language_manager.get_current_language()
+        self._cached_lang = lang
+
         # Update window title
         self.root.title(language_manager.get_text('main_title'))
         
         # Update all UI elements with new language
-        self._update_settings_frame_texts()
+        self._update_settings_frame_texts(lang)
         self._update_control_buttons_texts()
         self._update_info_frame_texts()
         self._update_processes_frame_texts()
         self._update_log_frames_texts()
 
-    def _update_settings_frame_texts(self):
+    def _apply_texts(self, pairs):
+        """Apply (widget, translation key) pairs in one pass."""
+        get_text = language_manager.get_text
+        for widget, key in pairs:
+            widget.configure(text=get_text(key))
+
+    def _update_settings_frame_texts(self, lang=None):
         """Update settings frame texts."""
-        self.settings_frame.config(text=language_manager.get_text('settings_frame'))
-        self.system_interval_label.config(text=language_manager.get_text('system_interval'))
-        self.network_interval_label.config(text=language_manager.get_text('network_interval'))
-        self.top_apps_label.config(text=language_manager.get_text('top_apps_count'))
-        self.auto_log_checkbox.config(text=language_manager.get_text('auto_log'))
-        self.webhook_button.config(text=language_manager.get_text('webhook_settings'))
-        
-        # Update language button text
-        current_lang = language_manager.get_current_language()
-        button_text = language_manager.get_text('language_english') if current_lang == 'en' else language_manager.get_text('language_turkish')
-        self.language_button.config(text=button_text)
+        is_en = language_manager.is_english() if lang is None else lang == 'en'
+        self._apply_texts([
+            (self.settings_frame, 'settings_frame'),
+            (self.system_interval_label, 'system_interval'),
+            (self.network_interval_label, 'network_interval'),
+            (self.top_apps_label, 'top_apps_count'),
+            (self.auto_log_checkbox, 'auto_log'),
+            (self.webhook_button, 'webhook_settings'),
+            # Language button text
+            (self.language_button, self._lang_btn_keys[is_en]),
+        ])
 
     def _update_control_buttons_texts(self):
         """Update control buttons texts."""
-        # Update monitoring frame title
-        self.monitor_frame.config(text=language_manager.get_text('monitoring_options'))
-        
-        self.chk_cpu.config(text=language_manager.get_text('monitor_cpu'))
-        self.chk_ram.config(text=language_manager.get_text('monitor_ram'))
-        self.chk_net.config(text=language_manager.get_text('monitor_network'))
-
-        if self.monitoring:
-            self.toggle_monitoring_btn.config(text=language_manager.get_text('stop_monitoring'))
-        else:
-            self.toggle_monitoring_btn.config(text=language_manager.get_text('start_monitoring'))
-
-        self.health_btn.config(text=language_manager.get_text('network_health_check'))
-        
-        # Network monitoring button text depends on current state
-        if self.network_monitoring:
-            self.network_auto_btn.config(text=language_manager.get_text('stop_auto_network'))
-        else:
-            self.network_auto_btn.config(text=language_manager.get_text('auto_network_monitoring'))
-            
-        self.temp_monitor_btn.config(text=language_manager.get_text('resource_temp_monitor'))
-        self.stress_test_btn.config(text=language_manager.get_text('cpu_stress_test'))
-        self.specs_btn.config(text=language_manager.get_text('system_specs_btn'))
+        pairs = [
+            # Monitoring frame title
+            (self.monitor_frame, 'monitoring_options'),
+            (self.chk_cpu, 'monitor_cpu'),
+            (self.chk_ram, 'monitor_ram'),
+            (self.chk_net, 'monitor_network'),
+            (self.health_btn, 'network_health_check'),
+            (self.temp_monitor_btn, 'resource_temp_monitor'),
+            (self.stress_test_btn, 'cpu_stress_test'),
+            (self.specs_btn, 'system_specs_btn'),
+            # Toggle buttons depend on current state
+            (self.toggle_monitoring_btn, self._monitor_btn_keys[self.monitoring]),
+            (self.network_auto_btn, self._net_btn_keys[self.network_monitoring]),
+        ]
+
+        self._apply_texts(pairs)
 
     def _update_info_frame_texts(self):
         """Update system information frame texts."""
-        self.info_frame.config(text=language_manager.get_text('system_info_frame'))
+        self._apply_texts([(self.info_frame, 'system_info_frame')])
         # Don't update the dynamic values, just reset the base text if showing defaults
-        if "--" in self.cpu_label.cget('text'):
-            self.cpu_label.config(text=language_manager.get_text('cpu_usage'))
-        if "--" in self.memory_label.cget('text'):
-            self.memory_label.config(text=language_manager.get_text('ram_usage'))
-        if "--" in self.network_label.cget('text'):
-            self.network_label.config(text=language_manager.get_text('network_status'))
+        if self._info_defaults_cpu:
+            self.cpu_var.set(language_manager.get_text('cpu_usage'))
+        if self._info_defaults_mem:
+            self.memory_var.set(language_manager.get_text('ram_usage'))
+        if self._info_defaults_net:
+            self.network_var.set(language_manager.get_text('network_status'))
 
     def _update_processes_frame_texts(self):
         """Update process frame texts."""
-        self.cpu_processes_frame.config(text=language_manager.get_text('top_cpu_apps'))
-        self.network_processes_frame.config(text=language_manager.get_text('top_network_apps'))
-        self.ram_processes_frame.config(text=language_manager.get_text('top_ram_apps'))
+        self._apply_texts([
+            (self.cpu_processes_frame, 'top_cpu_apps'),
+            (self.network_processes_frame, 'top_network_apps'),
+            (self.ram_processes_frame, 'top_ram_apps'),
+        ])
 
     def _update_log_frames_texts(self):
         """Update log frame texts."""
-        self.system_log_frame.config(text=language_manager.get_text('system_logs'))
-        self.network_log_frame.config(text=language_manager.get_text('network_logs'))
-        self.clear_system_btn.config(text=language_manager.get_text('clear_system_logs'))
-        self.export_system_btn.config(text=language_manager.get_text('export_system_logs'))
-        self.clear_network_btn.config(text=language_manager.get_text('clear_network_logs'))
-        self.export_network_btn.config(text=language_manager.get_text('export_network_logs'))
+        self._apply_texts([
+            (self.system_log_frame, 'system_logs'),
+            (self.network_log_frame, 'network_logs'),
+            (self.clear_system_btn, 'clear_system_logs'),
+            (self.export_system_btn, 'export_system_logs'),
+            (self.clear_network_btn, 'clear_network_logs'),
+            (self.export_network_btn, 'export_network_logs'),
+        ])
 
     def open_network_settings(self):
         """Open network settings dialog (management window)."""
-        if self.network_settings_window is None or not self.network_settings_window.winfo_exists():
-            self.network_settings_window = NetworkSettingsWindow(self.root, self.network_health_checker)
+        if self.network_settings_window is None:
+            from gui.network_settings_window import NetworkSettingsWindow
+            self._track_window('network_settings_window', NetworkSettingsWindow(self.root, self.network_health_checker))
         else:
             self.network_settings_window.lift()
             self.network_settings_window.focus_force()
 
     def open_webhook_settings(self):
         """Open (or focus) webhook settings window."""
-        if self.webhook_settings_window is None or not self.webhook_settings_window.winfo_exists():
-            self.webhook_settings_window = WebhookSettingsWindow(self.root, self.webhook_config, self.webhook_notifier)
+        if self.webhook_settings_window is None:
+            from gui.webhook_settings_window import WebhookSettingsWindow
+            self._track_window('webhook_settings_window', WebhookSettingsWindow(self.root, self, self.webhook_config, self.webhook_notifier))
         else:
             self.webhook_settings_window.lift()
             self.webhook_settings_window.focus_force()
 
     def open_system_specs(self):
         """Open System Specs window."""
-        if self.system_specs_window is None or not self.system_specs_window.winfo_exists():
-            self.system_specs_window = SystemSpecsWindow(self.root)
+        if self.system_specs_window is None:
+            from gui.system_info_window import SystemSpecsWindow
+            self._track_window('system_specs_window', SystemSpecsWindow(self.root, self))
         else:
             self.system_specs_window.lift()
             self.system_specs_window.focus_force()
 
     def open_wifi_analyzer(self):
         """Open Wi-Fi Analyzer window."""
-        if self.wifi_window is None or not self.wifi_window.winfo_exists():
-            self.wifi_window = WifiWindow(self.root)
+        if self.wifi_window is None:
+            from gui.wifi_window import WifiWindow
+            self._track_window('wifi_window', WifiWindow(self.root, self))
         else:
             self.wifi_window.lift()
             self.wifi_window.focus_force()
 
     def open_windows_tools(self):
         """Open Windows Tools window."""
-        if WindowsToolsWindow is None:
+        if not WINDOWS_TOOLS_AVAILABLE:
             return
 
-        if self.windows_tools_window is None or not self.windows_tools_window.winfo_exists():
-            self.windows_tools_window = WindowsToolsWindow(self.root)
+        if self.windows_tools_window is None:
+            from gui.windows_tools_window import WindowsToolsWindow
+            self._track_window('windows_tools_window', WindowsToolsWindow(self.root))
         else:
             self.windows_tools_window.lift()
             self.windows_tools_window.focus_force()
@@ -2,6 +2,9 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 from core.language import language_manager
 
+# Listbox row for a (name, address) host
+_HOST_ROW_FMT = "%s (%s)"
+
 
 class NetworkSettingsWindow(tk.Toplevel):
     """Network test hostlarını yönetmek için pencere."""
@@ -57,9 +60,10 @@ class NetworkSettingsWindow(tk.Toplevel):
         self.close_btn.grid(row=3, column=3, sticky='ew', **padding)
 
     def _populate_hosts(self):
+        items = [_HOST_ROW_FMT % host for host in self.network_checker.test_hosts]
         self.host_listbox.delete(0, tk.END)
-        for name, addr in self.network_checker.test_hosts:
-            self.host_listbox.insert(tk.END, f"{name} ({addr})")
+        # One Tcl call for the whole list
+        self.host_listbox.insert(tk.END, *items)
 
     # Actions
     def _add_host(self):
@@ -72,9 +76,9 @@ class NetworkSettingsWindow(tk.Toplevel):
             )
             return
         self.network_checker.add_host(name, addr)
+        self.host_listbox.insert(tk.END, _HOST_ROW_FMT % (name, addr))
         self.name_entry.delete(0, tk.END)
         self.address_entry.delete(0, tk.END)
-        self._populate_hosts()
 
     def _remove_selected(self):
         selection = list(self.host_listbox.curselection())
@@ -87,8 +91,8 @@ class NetworkSettingsWindow(tk.Toplevel):
         # Remove from highest index to lowest
         for idx in sorted(selection, reverse=True):
             # test_hosts ile listbox aynı sırada
-            self.network_checker.remove_host(idx)
-        self._populate_hosts()
+            if self.network_checker.remove_host(idx) is not None:
+                self.host_listbox.delete(idx)
 
     def _reset_defaults(self):
         self.network_checker.reset_to_defaults()
@@ -108,8 +112,7 @@ class NetworkSettingsWindow(tk.Toplevel):
         self.remove_btn.config(text=language_manager.get_text('remove_host_btn'))
         self.reset_btn.config(text=language_manager.get_text('reset_hosts_btn'))
         self.close_btn.config(text=language_manager.get_text('close_window_btn'))
-        # Listeyi yeniden doldur (metin formatı aynı ama yeniden çizim iyi olabilir)
-        self._populate_hosts()
+        # Host satırları dilden bağımsız, listeyi yeniden doldurmaya gerek yok
 
     def _on_close(self):
         self.destroy()
@@ -33,7 +33,7 @@ class PathEditorWindow(tk.Toplevel):
         list_frame = ttk.Frame(self, padding="10")
         list_frame.pack(fill=tk.BOTH, expand=True)
         
-        self.listbox = tk.Listbox(list_frame, selectmode=tk.SINGLE)
+        self.listbox = tk.Listbox(list_frame, selectmode=tk.EXTENDED)
         self.listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         
         scrollbar = ttk.Scrollbar(list_frame, orient=tk.VERTICAL, command=self.listbox.yview)
@@ -56,8 +56,7 @@ class PathEditorWindow(tk.Toplevel):
         scope = self.scope_var.get()
         self.current_paths = WindowsUtils.get_path_variable(scope)
         self.listbox.delete(0, tk.END)
-        for p in self.current_paths:
-            self.listbox.insert(tk.END, p)
+        self.listbox.insert(tk.END, *self.current_paths)
             
     def add_path(self):
         new_path = simpledialog.askstring("Add Path", "Enter new path:")
@@ -80,10 +79,12 @@ class PathEditorWindow(tk.Toplevel):
     def delete_path(self):
         sel = self.listbox.curselection()
         if not sel: return
-        if messagebox.askyesno("Delete", "Remove this path?"):
-            idx = sel[0]
-            del self.current_paths[idx]
-            self.listbox.delete(idx)
+        message = "Remove this path?" if len(sel) == 1 else f"Remove {len(sel)} paths?"
+        if messagebox.askyesno("Delete", message):
+            # Highest index first so the remaining indices stay valid
+            for idx in sorted(sel, reverse=True):
+                del self.current_paths[idx]
+                self.listbox.delete(idx)
 
     def save_changes(self):
         scope = self.scope_var.get()
@@ -6,9 +6,10 @@ and optional logging functionality.
 """
 
 import os
+import re
 import time
-import threading
 import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
 from tkinter import ttk, messagebox
 from datetime import datetime
 from typing import Optional, Tuple
@@ -19,15 +20,68 @@ from utils.logging import FileManager
 import psutil
 
 
+# Per-tick label templates
+_USAGE_FMT = "Usage: %.1f %%"
+_RAM_PERCENT_FMT = "Usage (%%): %.1f %%"
+_RAM_MB_FMT = "Usage (MB): %.0f / %.0f MB"
+_TEMP_FMT = "Temperature: %.1f °C"
+_MIN_FMT = "Min: %.1f °C"
+_MAX_FMT = "Max: %.1f °C"
+_TEMP_NA = "Temperature: Not Available"
+_MINMAX_NA = ("Min: -", "Max: -")
+
+# (temperature, min, max) label attributes of each temperature row
+_CPU_TEMP_LABELS = ('cpu_temp_label', 'cpu_temp_min_label', 'cpu_temp_max_label')
+_GPU_TEMP_LABELS = ('gpu_temp_label', 'gpu_temp_min_label', 'gpu_temp_max_label')
+
+# Log line templates
+_TIMESTAMP_FMT = "%Y-%m-%d %H:%M:%S"
+_LOG_FMT = "[%s] CPU: %.1f%% | %s | GPU: %s | %s | RAM: %.1f%% (%.0fMB/%.0fMB)\n"
+_LOG_TEMP_FMT = "%.1f°C"
+_LOG_USAGE_FMT = "%.1f%%"
+
+# Reading sections: (header text key, rows of (label attribute, initial text key))
+_MONITOR_SECTIONS = (
+    ('cpu_header', (
+        (('cpu_usage_label', 'usage'),),
+        (('cpu_temp_label', 'temperature'), ('cpu_temp_min_label', 'min_temp'), ('cpu_temp_max_label', 'max_temp')),
+    )),
+    ('gpu_header', (
+        (('gpu_usage_label', 'usage'),),
+        (('gpu_temp_label', 'temperature'), ('gpu_temp_min_label', 'min_temp'), ('gpu_temp_max_label', 'max_temp')),
+    )),
+    ('ram_header', (
+        (('ram_usage_label', 'usage_percent'),),
+        (('ram_usage_mb_label', 'usage_mb'),),
+    )),
+)
+
+# Rotated log file names: logs/resource_temp_log_<index>.txt
+_LOG_NAME_RE = re.compile(r"resource_temp_log_(\d+)\.txt$")
+
+_BYTES_TO_MB = 1.0 / (1024 * 1024)
+
+# Readings are either numbers or a display string (e.g. "N/A")
+_NUMBER_TYPES = frozenset((int, float))
+
+
 class ResourceTempMonitorWindow(tk.Toplevel):
     """Resource and Temperature Monitor window class."""
 
-    def __init__(self, master):
+    def __init__(self, master, app):
         super().__init__(master)
         self.title(language_manager.get_text('resource_temp_title'))
         self.geometry("580x480")
+        self.app = app
         self.monitoring = False
         self.update_interval = 2  # seconds
+        self._tick_id = None
+        self._pending = None  # Future of the collection in progress
+        self._label_vars = {}  # Label attribute name -> StringVar bound as its textvariable
+        self._label_texts = {}  # Last text written to each per-tick label
+        self._labels_dirty = False  # A label changed during the current _update_gui
+        # Hardware probes (WMI, nvidia-smi) block, so they run on one worker thread
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='rc-hw')
         
         # Logging properties
         self.logging_enabled = False
@@ -36,6 +90,8 @@ class ResourceTempMonitorWindow(tk.Toplevel):
         self.log_file_path = None
         self.log_file_index = 0
         self.max_log_size = 500 * 1024  # 500KB
+        self._log_fh = None  # Open handle of the current log file
+        self._log_size = 0  # Bytes written to the current log file
 
         # Min/Max value tracking
         self.cpu_temp_min = float('inf')
@@ -56,10 +112,7 @@ class ResourceTempMonitorWindow(tk.Toplevel):
         self.columnconfigure(0, weight=1)
         self.rowconfigure(0, weight=1)
 
-        # Setup label styles
-        style = ttk.Style(self)
-        style.configure("Monitor.TLabel", font=("Helvetica", 12))
-        style.configure("Header.TLabel", font=("Helvetica", 14, "bold"))
+        # Label styles (Monitor.TLabel, MonitorHeader.TLabel) are registered in gui.styles
 
         row = 0
         
@@ -91,57 +144,30 @@ class ResourceTempMonitorWindow(tk.Toplevel):
         
         row += 1
         
-        # --- CPU ---
-        ttk.Label(main_frame, text=language_manager.get_text('cpu_header'), style="Header.TLabel").grid(row=row, column=0, columnspan=4, sticky="w",
-                                                                      pady=(0, 5))
-        row += 1
-        self.cpu_usage_label = ttk.Label(main_frame, text=language_manager.get_text('usage'), style="Monitor.TLabel")
-        self.cpu_usage_label.grid(row=row, column=0, columnspan=4, sticky="w", padx=10)
-        row += 1
-        self.cpu_temp_label = ttk.Label(main_frame, text=language_manager.get_text('temperature'), style="Monitor.TLabel")
-        self.cpu_temp_label.grid(row=row, column=0, sticky="w", padx=10)
-        self.cpu_temp_min_label = ttk.Label(main_frame, text=language_manager.get_text('min_temp'), style="Monitor.TLabel")
-        self.cpu_temp_min_label.grid(row=row, column=1, sticky="w")
-        self.cpu_temp_max_label = ttk.Label(main_frame, text=language_manager.get_text('max_temp'), style="Monitor.TLabel")
-        self.cpu_temp_max_label.grid(row=row, column=2, sticky="w")
-        row += 1
-
-        # --- GPU ---
-        ttk.Separator(main_frame, orient="horizontal").grid(row=row, column=0, columnspan=4, sticky="ew", pady=10)
-        row += 1
-        ttk.Label(main_frame, text=language_manager.get_text('gpu_header'), style="Header.TLabel").grid(row=row, column=0, columnspan=4, sticky="w",
-                                                                      pady=(0, 5))
-        row += 1
-        self.gpu_usage_label = ttk.Label(main_frame, text=language_manager.get_text('usage'), style="Monitor.TLabel")
-        self.gpu_usage_label.grid(row=row, column=0, columnspan=4, sticky="w", padx=10)
-        row += 1
-        self.gpu_temp_label = ttk.Label(main_frame, text=language_manager.get_text('temperature'), style="Monitor.TLabel")
-        self.gpu_temp_label.grid(row=row, column=0, sticky="w", padx=10)
-        self.gpu_temp_min_label = ttk.Label(main_frame, text=language_manager.get_text('min_temp'), style="Monitor.TLabel")
-        self.gpu_temp_min_label.grid(row=row, column=1, sticky="w")
-        self.gpu_temp_max_label = ttk.Label(main_frame, text=language_manager.get_text('max_temp'), style="Monitor.TLabel")
-        self.gpu_temp_max_label.grid(row=row, column=2, sticky="w")
-        row += 1
-
-        # --- RAM ---
-        ttk.Separator(main_frame, orient="horizontal").grid(row=row, column=0, columnspan=4, sticky="ew", pady=10)
-        row += 1
-        ttk.Label(main_frame, text=language_manager.get_text('ram_header'), style="Header.TLabel").grid(row=row, column=0, columnspan=4, sticky="w",
-                                                                      pady=(0, 5))
-        row += 1
-        self.ram_usage_label = ttk.Label(main_frame, text=language_manager.get_text('usage_percent'), style="Monitor.TLabel")
-        self.ram_usage_label.grid(row=row, column=0, columnspan=4, sticky="w", padx=10)
-        row += 1
-        self.ram_usage_mb_label = ttk.Label(main_frame, text=language_manager.get_text('usage_mb'), style="Monitor.TLabel")
-        self.ram_usage_mb_label.grid(row=row, column=0, columnspan=4, sticky="w", padx=10)
-        row += 1
+        # --- CPU / GPU / RAM sections ---
+        for index, (header_key, label_rows) in enumerate(_MONITOR_SECTIONS):
+            if index:
+                ttk.Separator(main_frame, orient="horizontal").grid(row=row, column=0, columnspan=4, sticky="ew", pady=10)
+                row += 1
+            ttk.Label(main_frame, text=language_manager.get_text(header_key), style="MonitorHeader.TLabel").grid(
+                row=row, column=0, columnspan=4, sticky="w", pady=(0, 5))
+            row += 1
+            for label_row in label_rows:
+                # A lone label spans the row; otherwise one label per column
+                span = 4 if len(label_row) == 1 else 1
+                for column, (attr, text_key) in enumerate(label_row):
+                    var = tk.StringVar(self, value=language_manager.get_text(text_key))
+                    self._label_vars[attr] = var
+                    label = ttk.Label(main_frame, textvariable=var, style="Monitor.TLabel")
+                    label.grid(row=row, column=column, columnspan=span, sticky="w", padx=10 if column == 0 else 0)
+                    setattr(self, attr, label)
+                row += 1
 
     def start_monitoring(self):
-        """Start monitoring in a separate thread."""
+        """Start periodic monitoring on the Tk event loop."""
         if not self.monitoring:
             self.monitoring = True
-            self.monitor_thread = threading.Thread(target=self._update_worker, daemon=True)
-            self.monitor_thread.start()
+            self._tick()
     
     def toggle_logging(self):
         """Toggle log recording on/off."""
@@ -154,8 +180,7 @@ class ResourceTempMonitorWindow(tk.Toplevel):
             self._write_log("=== Resource & Temperature Monitoring Log Started ===\n")
         else:
             self.log_status_label.config(text=language_manager.get_text('log_status_inactive'), foreground="red")
-            if self.log_file_path:
-                self._write_log("=== Resource & Temperature Monitoring Log Stopped ===\n")
+            self._close_log_file("=== Resource & Temperature Monitoring Log Stopped ===\n")
     
     def on_log_interval_change(self, event=None):
         """Handle log interval change."""
@@ -174,20 +199,17 @@ class ResourceTempMonitorWindow(tk.Toplevel):
             FileManager.ensure_directory_exists("logs")
             
             # Find existing files and select highest index
-            base_name = "logs/resource_temp_log"
-            existing_indices = []
+            max_index = 0
             try:
-                for fname in os.listdir("logs"):
-                    if fname.startswith("resource_temp_log_") and fname.endswith(".txt"):
-                        try:
-                            idx_part = fname[len("resource_temp_log_"):-4]
-                            existing_indices.append(int(idx_part))
-                        except ValueError:
-                            pass
+                with os.scandir("logs") as entries:
+                    for entry in entries:
+                        match = _LOG_NAME_RE.match(entry.name)
+                        if match:
+                            max_index = max(max_index, int(match.group(1)))
             except FileNotFoundError:
                 pass
             
-            self.log_file_index = max(existing_indices) if existing_indices else 0
+            self.log_file_index = max_index
             self._rotate_log_file(force_new=True)
             
         except Exception as e:
@@ -195,7 +217,8 @@ class ResourceTempMonitorWindow(tk.Toplevel):
     
     def _rotate_log_file(self, force_new=False):
         """Rotate log file."""
-        if force_new or not self.log_file_path or self._get_log_file_size() >= self.max_log_size:
+        if force_new or self._log_fh is None or self._log_size >= self.max_log_size:
+            self._close_log_file()
             self.log_file_index += 1
             self.log_file_path = f"logs/resource_temp_log_{self.log_file_index}.txt"
             
@@ -208,33 +231,42 @@ class ResourceTempMonitorWindow(tk.Toplevel):
                 + "=" * 60 + "\n"
             )
             
+            # The file stays open until it is rotated or logging stops
             try:
-                with open(self.log_file_path, 'w', encoding='utf-8') as f:
-                    f.write(header)
+                self._log_fh = open(self.log_file_path, 'w', encoding='utf-8')
+                self._log_fh.write(header)
+                self._log_size = self._log_fh.tell()
             except Exception as e:
+                self._log_fh = None
                 print(f"Log file creation error: {e}")
-    
-    def _get_log_file_size(self):
-        """Get log file size."""
-        if self.log_file_path and os.path.exists(self.log_file_path):
-            try:
-                return os.path.getsize(self.log_file_path)
-            except Exception:
-                return 0
-        return 0
+
+    def _close_log_file(self, footer=None):
+        """Optionally write a final line, then close the current log file."""
+        if self._log_fh is None:
+            return
+        try:
+            if footer:
+                self._log_fh.write(footer)
+            self._log_fh.close()
+        except Exception as e:
+            print(f"Log close error: {e}")
+        self._log_fh = None
     
     def _write_log(self, message):
         """Write log message."""
-        if not self.logging_enabled or not self.log_file_path:
+        if not self.logging_enabled or self._log_fh is None:
             return
             
         try:
             # Size check
-            if self._get_log_file_size() >= self.max_log_size:
+            if self._log_size >= self.max_log_size:
                 self._rotate_log_file(force_new=True)
             
-            with open(self.log_file_path, 'a', encoding='utf-8') as f:
-                f.write(message)
+            self._log_fh.write(message)
+            # Keep the file readable while logging is on (no reopen or size syscall)
+            self._log_fh.flush()
+            # Position of the open file, counted after newline translation
+            self._log_size = self._log_fh.tell()
         except Exception as e:
             print(f"Log write error: {e}")
     
@@ -271,116 +303,147 @@ class ResourceTempMonitorWindow(tk.Toplevel):
             return True
         return False
 
-    def _update_worker(self):
-        """Data collection and GUI update worker thread."""
-        while self.monitoring:
-            # Collect data
-            cpu_usage = psutil.cpu_percent(interval=None)
-            mem_info = psutil.virtual_memory()
-            ram_usage_percent = mem_info.percent
-            ram_used_mb = mem_info.used / (1024 * 1024)
-            ram_total_mb = mem_info.total / (1024 * 1024)
-
-            # CPU Temperature (using new method)
-            cpu_temp = HardwareMonitor.get_cpu_temperature()
-
-            # GPU data (try our hidden nvidia-smi call first, then GPUtil fallback)
-            gpu_usage, gpu_temp = "N/A", "N/A"
-            n_util, n_temp = HardwareMonitor.get_nvidia_gpu_info()
-            if isinstance(n_util, (int, float)) and isinstance(n_temp, (int, float)):
-                gpu_usage, gpu_temp = n_util, n_temp
-            else:
-                gpu_usage_str, gpu_temp_str = HardwareMonitor.get_gpu_info_fallback()
-                gpu_usage, gpu_temp = gpu_usage_str, gpu_temp_str
-
-            # Update Min/Max values
-            if isinstance(cpu_temp, (int, float)):
-                self.cpu_temp_min = min(self.cpu_temp_min, cpu_temp)
-                self.cpu_temp_max = max(self.cpu_temp_max, cpu_temp)
-            if isinstance(gpu_temp, (int, float)):
-                self.gpu_temp_min = min(self.gpu_temp_min, gpu_temp)
-                self.gpu_temp_max = max(self.gpu_temp_max, gpu_temp)
-
-            # Schedule GUI update
-            data = {
-                'cpu_usage': cpu_usage,
-                'ram_usage_percent': ram_usage_percent,
-                'ram_used_mb': ram_used_mb,
-                'ram_total_mb': ram_total_mb,
-                'cpu_temp': cpu_temp,
-                'gpu_usage': gpu_usage,
-                'gpu_temp': gpu_temp,
-            }
-            if self.monitoring:  # Check if window is still open to avoid errors
-                self.after(0, self._update_gui, data)
-            
-            # Log recording check
-            if self.logging_enabled and self._should_log_now():
-                self._log_current_data(data)
+    def _tick(self):
+        """Start a data collection on the worker and re-arm the timer."""
+        if not self.monitoring:
+            return
+        # A slow probe still running simply skips this tick
+        if self._pending is None or self._pending.done():
+            self._pending = self._executor.submit(self._collect_data)
+            self._pending.add_done_callback(self._on_collected)
+        self._tick_id = self.after(self.update_interval * 1000, self._tick)
+
+    def _collect_data(self):
+        """Collect one sample (worker thread, no widget access)."""
+        cpu_usage = psutil.cpu_percent(interval=None)
+        mem_info = psutil.virtual_memory()
+
+        # CPU Temperature (using new method)
+        cpu_temp = HardwareMonitor.get_cpu_temperature()
+
+        # GPU data (try our hidden nvidia-smi call first, then GPUtil fallback)
+        n_util, n_temp = HardwareMonitor.get_nvidia_gpu_info()
+        if isinstance(n_util, (int, float)) and isinstance(n_temp, (int, float)):
+            gpu_usage, gpu_temp = n_util, n_temp
+        else:
+            gpu_usage, gpu_temp = HardwareMonitor.get_gpu_info_fallback()
+
+        return {
+            'cpu_usage': cpu_usage,
+            'ram_usage_percent': mem_info.percent,
+            'ram_used_mb': mem_info.used * _BYTES_TO_MB,
+            'ram_total_mb': mem_info.total * _BYTES_TO_MB,
+            'cpu_temp': cpu_temp,
+            'gpu_usage': gpu_usage,
+            'gpu_temp': gpu_temp,
+        }
+
+    def _on_collected(self, future):
+        """Hand a finished collection to the Tk thread (runs on the worker)."""
+        if not self.monitoring or future.cancelled() or future.exception() is not None:
+            return
+        self.app.post_to_gui(self._apply_data, future.result())
+
+    def _apply_data(self, data):
+        """Apply a collected sample: min/max tracking, labels and log (Tk thread)."""
+        if not self.monitoring:
+            return
+
+        # Update Min/Max values
+        cpu_temp, gpu_temp = data['cpu_temp'], data['gpu_temp']
+        if type(cpu_temp) in _NUMBER_TYPES:
+            if cpu_temp < self.cpu_temp_min:
+                self.cpu_temp_min = cpu_temp
+            if cpu_temp > self.cpu_temp_max:
+                self.cpu_temp_max = cpu_temp
+        if type(gpu_temp) in _NUMBER_TYPES:
+            if gpu_temp < self.gpu_temp_min:
+                self.gpu_temp_min = gpu_temp
+            if gpu_temp > self.gpu_temp_max:
+                self.gpu_temp_max = gpu_temp
 
-            time.sleep(self.update_interval)
+        self._update_gui(data)
+
+        # Log recording check
+        if self.logging_enabled and self._should_log_now():
+            self._log_current_data(data)
 
     def _log_current_data(self, data):
         """Log current data to file."""
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        
-        # CPU temp format
-        cpu_temp_str = f"{data['cpu_temp']:.1f}°C" if isinstance(data['cpu_temp'], (int, float)) else str(data['cpu_temp'])
-        
-        # GPU temp format
-        gpu_temp_str = f"{data['gpu_temp']:.1f}°C" if isinstance(data['gpu_temp'], (int, float)) else str(data['gpu_temp'])
-        
-        # GPU usage format
-        gpu_usage_str = f"{data['gpu_usage']:.1f}%" if isinstance(data['gpu_usage'], (int, float)) else str(data['gpu_usage'])
+        timestamp = time.strftime(_TIMESTAMP_FMT)
         
-        log_line = (
-            f"[{timestamp}] "
-            f"CPU: {data['cpu_usage']:.1f}% | {cpu_temp_str} | "
-            f"GPU: {gpu_usage_str} | {gpu_temp_str} | "
-            f"RAM: {data['ram_usage_percent']:.1f}% ({data['ram_used_mb']:.0f}MB/{data['ram_total_mb']:.0f}MB)\n"
-        )
+        cpu_temp, gpu_temp, gpu_usage = data['cpu_temp'], data['gpu_temp'], data['gpu_usage']
+        cpu_temp_str = _LOG_TEMP_FMT % cpu_temp if type(cpu_temp) in _NUMBER_TYPES else str(cpu_temp)
+        gpu_temp_str = _LOG_TEMP_FMT % gpu_temp if type(gpu_temp) in _NUMBER_TYPES else str(gpu_temp)
+        gpu_usage_str = _LOG_USAGE_FMT % gpu_usage if type(gpu_usage) in _NUMBER_TYPES else str(gpu_usage)
+
+        log_line = _LOG_FMT % (
+            timestamp, data['cpu_usage'], cpu_temp_str, gpu_usage_str, gpu_temp_str,
+            data['ram_usage_percent'], data['ram_used_mb'], data['ram_total_mb'])
         
         self._write_log(log_line)
 
+    def _set_text(self, attr, text):
+        """Set a reading label's variable only when its text actually changes."""
+        if self._label_texts.get(attr) != text:
+            self._label_texts[attr] = text
+            self._label_vars[attr].set(text)
+            self._labels_dirty = True
+
+    def _set_temp_block(self, labels, value, low, high, na_text=None):
+        """Set a temperature label and its min/max labels, or their N/A texts.
+
+        na_text defaults to showing the non-numeric reading itself.
+        """
+        temp_attr, min_attr, max_attr = labels
+        if type(value) in _NUMBER_TYPES:
+            self._set_text(temp_attr, _TEMP_FMT % value)
+            self._set_text(min_attr, _MIN_FMT % low)
+            self._set_text(max_attr, _MAX_FMT % high)
+        else:
+            self._set_text(temp_attr, na_text or f"Temperature: {value}")
+            self._set_text(min_attr, _MINMAX_NA[0])
+            self._set_text(max_attr, _MINMAX_NA[1])
+
     def _update_gui(self, data):
         """Update interface labels."""
         if not self.winfo_exists():
             return
+        # Minimized or withdrawn: nothing to draw (collection and logging go on)
+        if not self.winfo_viewable():
+            return
 
-        self.cpu_usage_label.config(text=f"Usage: {data['cpu_usage']:.1f} %")
-        self.ram_usage_label.config(text=f"Usage (%): {data['ram_usage_percent']:.1f} %")
-        self.ram_usage_mb_label.config(text=f"Usage (MB): {data['ram_used_mb']:.0f} / {data['ram_total_mb']:.0f} MB")
+        self._labels_dirty = False
+        self._set_text('cpu_usage_label', _USAGE_FMT % data['cpu_usage'])
+        self._set_text('ram_usage_label', _RAM_PERCENT_FMT % data['ram_usage_percent'])
+        self._set_text('ram_usage_mb_label', _RAM_MB_FMT % (data['ram_used_mb'], data['ram_total_mb']))
 
         cpu_temp = data['cpu_temp']
-        if isinstance(cpu_temp, (int, float)):
-            self.cpu_temp_label.config(text=f"Temperature: {cpu_temp:.1f} °C")
-            self.cpu_temp_min_label.config(text=f"Min: {self.cpu_temp_min:.1f} °C")
-            self.cpu_temp_max_label.config(text=f"Max: {self.cpu_temp_max:.1f} °C")
-        else:
-            self.cpu_temp_label.config(text="Temperature: Not Available")
-            self.cpu_temp_min_label.config(text="Min: -")
-            self.cpu_temp_max_label.config(text="Max: -")
+        self._set_temp_block(_CPU_TEMP_LABELS, cpu_temp, self.cpu_temp_min, self.cpu_temp_max, _TEMP_NA)
 
-        if isinstance(data['gpu_usage'], (int, float)):
-            self.gpu_usage_label.config(text=f"Usage: {data['gpu_usage']:.1f} %")
+        gpu_usage = data['gpu_usage']
+        if type(gpu_usage) in _NUMBER_TYPES:
+            self._set_text('gpu_usage_label', _USAGE_FMT % gpu_usage)
         else:
-            self.gpu_usage_label.config(text=f"Usage: {data['gpu_usage']}")
+            self._set_text('gpu_usage_label', f"Usage: {gpu_usage}")
 
-        if isinstance(data['gpu_temp'], (int, float)):
-            self.gpu_temp_label.config(text=f"Temperature: {data['gpu_temp']:.1f} °C")
-            self.gpu_temp_min_label.config(text=f"Min: {self.gpu_temp_min:.1f} °C")
-            self.gpu_temp_max_label.config(text=f"Max: {self.gpu_temp_max:.1f} °C")
-        else:
-            self.gpu_temp_label.config(text=f"Temperature: {data['gpu_temp']}")
-            self.gpu_temp_min_label.config(text="Min: -")
-            self.gpu_temp_max_label.config(text="Max: -")
+        gpu_temp = data['gpu_temp']
+        self._set_temp_block(_GPU_TEMP_LABELS, gpu_temp, self.gpu_temp_min, self.gpu_temp_max)
+
+        # One layout/redraw pass for all changed labels (not update(): no nested event loop)
+        if self._labels_dirty:
+            self.update_idletasks()
 
     def on_close(self):
         """Handle window close event."""
         # Stop logging
         if self.logging_enabled:
-            self._write_log("=== Resource & Temperature Monitoring Log Ended (Window Closed) ===\n")
+            self._close_log_file("=== Resource & Temperature Monitoring Log Ended (Window Closed) ===\n")
             self.logging_enabled = False
         
         self.monitoring = False
+        if self._tick_id is not None:
+            self.after_cancel(self._tick_id)
+            self._tick_id = None
+        self._executor.shutdown(wait=False, cancel_futures=True)
         self.destroy()
\ No newline at end of file
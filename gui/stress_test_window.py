@@ -5,14 +5,16 @@ Provides a dedicated window for running CPU stress tests with performance scorin
 """
 
 import time
-import threading
 import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 import tkinter as tk
 from tkinter import ttk
 import psutil
 import math
 
 from core.language import language_manager
+from core.system_info import SystemInfo
 
 # --- Workload size & weighting (stabilized constants) ---
 # Loop iteration counts per batch (keep these constant for comparable runs)
@@ -25,70 +27,256 @@ WEIGHT_INT = 1.0
 WEIGHT_BIT = 1.0
 WEIGHT_FLOAT = 1.0
 
+# Approximate operation cost of one batch using the weights
+# (integer for the shared 'Q' op counters)
+BATCH_OPS = int(
+    INT_INNER * WEIGHT_INT +
+    BIT_INNER * WEIGHT_BIT +
+    FLOAT_INNER * WEIGHT_FLOAT
+)
+
 
 # --- CPU intensive worker (runs in a separate process) ---
-def _process_stress_worker(stop_event, counter):
-    """CPU intensive loop executed in its own separate process.
+def _stress_batch(floats, angle):
+    """Run one batch of the mixed workload.
+
+    Args:
+        floats: Small float array worked on by the floating point block (updated in place)
+        angle: Running angle of the floating point block
+
+    Returns:
+        (angle, acc) - the updated angle and the integer/bitwise result, returned so
+        a compiler cannot drop the integer blocks as dead code.
+    """
+    f_len = len(floats)
+    acc = 0
+    # Integer arithmetic block
+    for i in range(INT_INNER):
+        acc += i * i + (acc & 0xFFFF)
+    # Bitwise rotate / xor / mix. One scalar 32-bit chain on purpose: spreading it
+    # over NumPy uint32 lanes is slower at this size (per-call overhead), and extra
+    # lanes would change what one counted op means, breaking score comparability.
+    # Unrolled by 4 to cut loop overhead in the interpreted fallback.
+    x = acc & 0xffffffff
+    for _ in range(BIT_INNER // 4):
+        x = (((x << 5) | (x >> 27)) & 0xffffffff) ^ 0xA5A5A5A5
+        x = (((x << 5) | (x >> 27)) & 0xffffffff) ^ 0xA5A5A5A5
+        x = (((x << 5) | (x >> 27)) & 0xffffffff) ^ 0xA5A5A5A5
+        x = (((x << 5) | (x >> 27)) & 0xffffffff) ^ 0xA5A5A5A5
+    for _ in range(BIT_INNER % 4):
+        x = (((x << 5) | (x >> 27)) & 0xffffffff) ^ 0xA5A5A5A5
+    acc ^= x
+    # Floating point trig/mul/add
+    for j in range(FLOAT_INNER):
+        idx = j % f_len
+        angle += 0.0005
+        floats[idx] = math.sin(angle) * (floats[idx] + 1.0001) + 0.00001
+    return angle, acc
+
+
+def _fused_stress_batch(floats, angle):
+    """_stress_batch with the three blocks interleaved in one loop, for Numba.
+
+    Does the same abstract op count, but keeps acc, x and the float working value
+    live together so LLVM can overlap the integer, shift and floating point work.
+    The bit block is seeded with a constant instead of the integer result, so acc
+    differs from _stress_batch. Interpreted, the fused loop is slower than the
+    separate (unrolled) loops, so the fallbacks keep using _stress_batch.
+    """
+    f_len = len(floats)
+    acc = 0
+    x = 0x9E3779B9
+    fused = min(INT_INNER, BIT_INNER, FLOAT_INNER)
+    for k in range(fused):
+        acc += k * k + (acc & 0xFFFF)
+        x = (((x << 5) | (x >> 27)) & 0xffffffff) ^ 0xA5A5A5A5
+        idx = k % f_len
+        angle += 0.0005
+        floats[idx] = math.sin(angle) * (floats[idx] + 1.0001) + 0.00001
+    # Tails of the longer blocks
+    for k in range(fused, INT_INNER):
+        acc += k * k + (acc & 0xFFFF)
+    for _ in range(fused, BIT_INNER):
+        x = (((x << 5) | (x >> 27)) & 0xffffffff) ^ 0xA5A5A5A5
+    for k in range(fused, FLOAT_INNER):
+        idx = k % f_len
+        angle += 0.0005
+        floats[idx] = math.sin(angle) * (floats[idx] + 1.0001) + 0.00001
+    acc ^= x
+    return angle, acc
+
+
+def _load_native_batch(fastmath=True):
+    """Compile _fused_stress_batch with Numba if it is installed, else return None.
+
+    Imported inside the worker process so the GUI process never pays for Numba.
+    fastmath lets LLVM fuse the multiply-add and reassociate, which scores higher
+    but may round differently across CPUs; fastmath=False keeps strict IEEE order.
+    The fastmath kernel is cached on disk so later workers load it instead of
+    recompiling. Numba's cache index is not keyed by fastmath, so the strict
+    kernel is always compiled in-process rather than risk loading the fast one.
+    """
+    try:
+        import numpy as np
+        from numba import njit
+    except ImportError:
+        return None
+    try:
+        native = njit(cache=fastmath, fastmath=fastmath)(_fused_stress_batch)
+        # Compile (or load from cache) now, before the measured loop starts
+        native(np.zeros(50, dtype=np.float64), 0.0)
+        return native
+    except Exception:
+        return None
+
+
+def _load_numpy_batch(f_len):
+    """Build a _stress_batch variant with a NumPy float block, or return None.
+
+    Used when Numba is missing but NumPy is installed. Within one pass over the
+    float array every element is touched once, so each pass of the scalar loop
+    is a single vectorized sin/multiply-add; the integer blocks stay in Python.
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+    passes, rem = divmod(FLOAT_INNER, f_len)
+    steps = 0.0005 * np.arange(1, f_len + 1, dtype=np.float64)
+    sins = np.empty(f_len, dtype=np.float64)
+
+    def numpy_batch(floats, angle):
+        acc = 0
+        for i in range(INT_INNER):
+            acc += i * i + (acc & 0xFFFF)
+        x = acc & 0xffffffff
+        for _ in range(BIT_INNER // 4):
+            x = (((x << 5) | (x >> 27)) & 0xffffffff) ^ 0xA5A5A5A5
+            x = (((x << 5) | (x >> 27)) & 0xffffffff) ^ 0xA5A5A5A5
+            x = (((x << 5) | (x >> 27)) & 0xffffffff) ^ 0xA5A5A5A5
+            x = (((x << 5) | (x >> 27)) & 0xffffffff) ^ 0xA5A5A5A5
+        for _ in range(BIT_INNER % 4):
+            x = (((x << 5) | (x >> 27)) & 0xffffffff) ^ 0xA5A5A5A5
+        acc ^= x
+        for _ in range(passes):
+            np.sin(steps + angle, out=sins)
+            floats += 1.0001
+            floats *= sins
+            floats += 0.00001
+            angle += 0.0005 * f_len
+        if rem:
+            head = floats[:rem]
+            head += 1.0001
+            head *= np.sin(steps[:rem] + angle)
+            head += 0.00001
+            angle += 0.0005 * rem
+        return angle, acc
+
+    return numpy_batch
+
+
+# Display templates used on every score tick, fetched once per test by start_test
+_SCORE_TEMPLATE_KEYS = ('current_cpu_score', 'per_core_cpu_score', 'average_cpu_score',
+                        'peak_cpu_score', 'sustainability_value', 'test_duration_label')
+
+
+# Per-process state of a stress pool worker, set once by _init_stress_worker
+_active_run = None
+_op_counts = None
+_worker_kernels = {}  # fastmath flag -> (floats, batch)
+
+
+def _init_stress_worker(active_run, op_counts):
+    """Pool initializer: keep the shared objects and load the batch kernel.
+
+    Runs once per worker process, so the Numba compile (or cache load) and the
+    NumPy import are paid on the first test only; later tests reuse the worker.
+    """
+    global _active_run, _op_counts
+    _active_run = active_run
+    _op_counts = op_counts
+    _get_worker_kernel(True)
+
+
+def _get_worker_kernel(fastmath):
+    """Return this worker's (floats, batch) pair for the fastmath mode, loading it once."""
+    kernel = _worker_kernels.get(fastmath)
+    if kernel is not None:
+        return kernel
+    # A plain list for the interpreted loop: array.array('d') measured slower there,
+    # as every read and write boxes or unboxes a float; 50 floats stay cache-resident anyway
+    floats = [i * 0.001 for i in range(50)]
+    batch = _load_native_batch(fastmath) or _load_numpy_batch(len(floats))
+    if batch is not None:
+        import numpy as np
+        # float64 on purpose: float32 measured no faster (the loop is bound by the
+        # serial angle chain and sin, not bandwidth), and a float32 angle would
+        # stop advancing once its spacing exceeds the 0.0005 step
+        floats = np.array(floats, dtype=np.float64)
+    else:
+        batch = _stress_batch
+    kernel = _worker_kernels[fastmath] = (floats, batch)
+    return kernel
+
+
+def _process_stress_worker(run, index, cpu_id=None, fastmath=True):
+    """CPU intensive loop executed in a stress pool worker process.
 
     Purpose: measure per-core raw computational throughput of a mixed synthetic workload
     and expose an approximate operations-per-second figure (Million Ops / s) to the GUI.
 
-    Workload components in each batch:
+    Workload components in each batch (see _stress_batch):
             - Integer arithmetic (square + add)
             - Bitwise / rotate / xor mixing sequence
-            - Floating point math (sin + fused multiply-add) on a small float array
+            - Floating point math (sin + multiply-add) on a small float array
 
     We treat one iteration of each inner loop as one abstract operation. The combined
     abstract op count per batch is (INT_INNER + BIT_INNER + FLOAT_INNER). Once the
-    accumulated local_count reaches FLUSH_THRESHOLD we atomically add it to the shared
-    mp.Value counter. The monitor thread samples the counter delta over time to compute
-    MOp/s.
+    accumulated local_count reaches FLUSH_THRESHOLD we add it to _op_counts[index], this
+    worker's slot in a shared lock-free array. Consecutive runs use alternating halves
+    of the array, so a straggler of the previous run never shares a slot with a worker
+    of the current one. Each slot has a single writer and the
+    aligned 64-bit stores are read whole by the monitor thread, which samples the
+    total delta over time to compute MOp/s.
+
+    The loop runs while the shared _active_run value equals run; the window stops
+    a test by changing that value, which also ends any stragglers of older runs.
 
     Notes:
-        - This is NOT a hardware FLOPS benchmark; it is a relative Python-level synthetic
-          throughput indicator sensitive to core count, frequency, and interpreter overhead.
+        - This is NOT a hardware FLOPS benchmark; it is a relative synthetic throughput
+          indicator sensitive to core count and frequency.
+        - With Numba installed the batch runs as native code; with only NumPy the float
+          block is vectorized; otherwise it is interpreted and the score also reflects
+          interpreter overhead. Only compare runs made with the same kernel.
         - Keep environment comparable (background load, power plan) for meaningful comparisons.
+        - fastmath=False selects the strict Numba kernel (reproducible mode) for scores
+          that compare across CPUs with and without FMA; it does not affect the
+          NumPy or interpreted kernels.
+        - When cpu_id is given the worker pins itself to that logical CPU so it does not
+          migrate between cores mid-run; where affinity is unsupported it runs unpinned.
     """
+    if cpu_id is not None:
+        SystemInfo.set_cpu_affinity(cpu_id)
     local_count = 0
     # Diversified workload parameters (use global stabilized constants)
     FLUSH_THRESHOLD = 50_000  # accumulated abstract ops before sharing
 
-    # Pre-create float data to work on
-    floats = [i * 0.001 for i in range(50)]
-    f_len = len(floats)
+    active_run = _active_run
+    op_counts = _op_counts
+    floats, batch = _get_worker_kernel(fastmath)
     angle = 0.0
-    while not stop_event.is_set():
-        acc = 0
-        # Integer arithmetic block
-        for i in range(INT_INNER):
-            acc += i * i + (acc & 0xFFFF)
-        # Bitwise rotate / xor / mix
-        x = acc & 0xffffffff
-        for _ in range(BIT_INNER):
-            x = ((x << 5) | (x >> 27)) & 0xffffffff
-            x ^= 0xA5A5A5A5
-        acc ^= x
-        # Floating point trig/mul/add
-        for j in range(FLOAT_INNER):
-            idx = j % f_len
-            angle += 0.0005
-            floats[idx] = math.fma(math.sin(angle), floats[idx] + 1.0001, 0.00001)
-        # Approximate operation cost counting using weights
-        batch_ops = int(
-            INT_INNER * WEIGHT_INT +
-            BIT_INNER * WEIGHT_BIT +
-            FLOAT_INNER * WEIGHT_FLOAT
-        )  # ensure integer for atomic counter (mp.Value 'Q')
-        local_count += batch_ops  # stays int
+    while active_run.value == run:
+        angle, _ = batch(floats, angle)
+        local_count += BATCH_OPS  # stays int
         if local_count >= FLUSH_THRESHOLD:
-            with counter.get_lock():
-                # local_count guaranteed int
-                counter.value += int(local_count)
+            if active_run.value != run:
+                # Stopped mid-batch; these ops belong to no live run
+                return
+            op_counts[index] += local_count
             local_count = 0
-    # Flush remainder
-    if local_count:
-        with counter.get_lock():
-            counter.value += local_count
+    # Flush remainder only while our run is still the active one
+    if local_count and active_run.value == run:
+        op_counts[index] += local_count
 
 
 class CPUStressTestWindow(tk.Toplevel):
@@ -97,29 +285,37 @@ class CPUStressTestWindow(tk.Toplevel):
     def __init__(self, master, app):
         super().__init__(master)
         self.title(language_manager.get_text('stress_test_title'))
-        self.geometry("420x350")
+        self.geometry("420x380")
         self.app = app
         self.resizable(False, False)
         
         self.testing = False
-        self.processes = []  # multiprocessing.Process list
-        self.stop_events = []  # Per-process mp.Event objects
         self.cpu_count = psutil.cpu_count(logical=True)
+        # Worker processes are created on the first test and reused until the window closes
+        self._pool = None
+        self._active_run = None  # Shared 'Q' RawValue, id of the running test (0 = stopped)
+        self._run_id = 0
+        self.active_workers = 0
         
         # Performance scoring variables
-        self.test_start_time = None
+        self.test_start_ns = None  # time.monotonic_ns() at start, for durations
         self.performance_scores = []
+        # Running sum / max of performance_scores, kept in step with the list
+        self._score_sum = 0.0
+        self._score_max = 0.0
         self.score_interval = 2  # Calculate score every 2 seconds
-        self.last_score_time = 0
+        self._sample_after_id = None
         # Raw ops tracking
-        self.counters = []  # list[mp.Value]
+        self.op_counts = None  # Shared 'Q' RawArray, two slots per pool worker (see _create_pool)
+        self._slot_base = 0  # First op_counts slot of the current run
         self.last_total_ops = 0
-        self.last_ops_time = None
+        self.last_ops_ns = None
         self.peak_score = 0.0
         self.recent_scores = []  # for sustainability (last few samples)
 
         self.setup_widgets()
         self.protocol("WM_DELETE_WINDOW", self.on_close)
+        self.bind('<Destroy>', self._on_destroy, add='+')
 
     def setup_widgets(self):
         """Setup window widgets."""
@@ -138,6 +334,12 @@ class CPUStressTestWindow(tk.Toplevel):
         self.thread_combo.pack(side=tk.LEFT)
         self.thread_combo.set(str(self.cpu_count))  # Default to all cores
 
+        # Strict floating point kernel, for scores comparable across CPUs
+        self.reproducible_var = tk.BooleanVar(value=False)
+        self.reproducible_check = ttk.Checkbutton(main_frame, text=language_manager.get_text('reproducible_mode'),
+                                                  variable=self.reproducible_var)
+        self.reproducible_check.pack(anchor=tk.W, pady=(5, 0))
+
         # Control buttons
         self.start_button = ttk.Button(main_frame, text=language_manager.get_text('start_test'), command=self.start_test)
         self.start_button.pack(pady=10, fill=tk.X)
@@ -154,27 +356,33 @@ class CPUStressTestWindow(tk.Toplevel):
         performance_frame.pack(fill=tk.X, pady=(10, 0))
         
     # Current score
-        self.current_score_label = ttk.Label(performance_frame, text=language_manager.get_text('current_score'), font=("Arial", 10, "bold"))
+        self.current_score_var = tk.StringVar(value=language_manager.get_text('current_score'))
+        self.current_score_label = ttk.Label(performance_frame, textvariable=self.current_score_var, font=("Arial", 10, "bold"))
         self.current_score_label.pack(anchor=tk.W)
         
         # Per-core score label (added)
-        self.per_core_label = ttk.Label(performance_frame, text=language_manager.get_text('per_core_score'))
+        self.per_core_var = tk.StringVar(value=language_manager.get_text('per_core_score'))
+        self.per_core_label = ttk.Label(performance_frame, textvariable=self.per_core_var)
         self.per_core_label.pack(anchor=tk.W)
 
         # Average score
-        self.avg_score_label = ttk.Label(performance_frame, text=language_manager.get_text('average_score'))
+        self.avg_score_var = tk.StringVar(value=language_manager.get_text('average_score'))
+        self.avg_score_label = ttk.Label(performance_frame, textvariable=self.avg_score_var)
         self.avg_score_label.pack(anchor=tk.W)
         
         # Max score
-        self.max_score_label = ttk.Label(performance_frame, text=language_manager.get_text('max_score'))
+        self.max_score_var = tk.StringVar(value=language_manager.get_text('max_score'))
+        self.max_score_label = ttk.Label(performance_frame, textvariable=self.max_score_var)
         self.max_score_label.pack(anchor=tk.W)
 
         # Sustainability (thermal throttling indicator)
-        self.sustain_label = ttk.Label(performance_frame, text=language_manager.get_text('sustainability'))
+        self.sustain_var = tk.StringVar(value=language_manager.get_text('sustainability'))
+        self.sustain_label = ttk.Label(performance_frame, textvariable=self.sustain_var)
         self.sustain_label.pack(anchor=tk.W)
         
         # Test duration
-        self.test_duration_label = ttk.Label(performance_frame, text=language_manager.get_text('test_duration'))
+        self.test_duration_var = tk.StringVar(value=language_manager.get_text('test_duration'))
+        self.test_duration_label = ttk.Label(performance_frame, textvariable=self.test_duration_var)
         self.test_duration_label.pack(anchor=tk.W)
 
     def start_test(self):
@@ -183,30 +391,35 @@ class CPUStressTestWindow(tk.Toplevel):
             return
 
         self.testing = True
-        self.processes.clear()
-        self.stop_events.clear()
         self.performance_scores.clear()
-        self.test_start_time = time.time()
-        self.last_score_time = 0
+        self._score_sum = 0.0
+        self._score_max = 0.0
+        (self._t_current, self._t_per_core, self._t_average,
+         self._t_peak, self._t_sustain, self._t_duration) = map(language_manager.get_text, _SCORE_TEMPLATE_KEYS)
+        self.test_start_ns = time.monotonic_ns()
 
         try:
             num_threads = int(self.thread_var.get())
         except ValueError:
             num_threads = self.cpu_count
 
-        # Spawn processes (separate Python interpreter instances) to avoid GUI freeze
-        mp_ctx = mp.get_context("spawn")  # explicit for Windows compatibility
+        # Run the workload in worker processes (separate Python interpreters) to avoid GUI freeze
+        if self._pool is None:
+            self._create_pool()
+        self._run_id += 1
+        self._active_run.value = self._run_id
+        fastmath = not self.reproducible_var.get()
+        # One worker per logical CPU, round-robin if there are more workers than CPUs
+        cpus = SystemInfo.get_usable_cpus()
+        self._slot_base = (self._run_id & 1) * self.cpu_count
         for i in range(num_threads):
-            stop_event = mp_ctx.Event()
-            counter = mp_ctx.Value('Q', 0, lock=True)  # 64-bit unsigned
-            proc = mp_ctx.Process(target=_process_stress_worker, args=(stop_event, counter), daemon=True)
-            proc.start()
-            self.stop_events.append(stop_event)
-            self.processes.append(proc)
-            self.counters.append(counter)
+            cpu_id = cpus[i % len(cpus)] if cpus else None
+            self._submit_worker(self._run_id, self._slot_base + i, cpu_id, fastmath)
+        self.active_workers = num_threads
 
-        self.last_total_ops = 0
-        self.last_ops_time = time.time()
+        # Counters keep growing across runs; scores only use deltas from here
+        self.last_total_ops = self._run_total_ops()
+        self.last_ops_ns = time.monotonic_ns()
         self.peak_score = 0.0
         self.recent_scores.clear()
 
@@ -214,11 +427,11 @@ class CPUStressTestWindow(tk.Toplevel):
         self.start_button.config(state=tk.DISABLED)
         self.stop_button.config(state=tk.NORMAL)
         self.thread_combo.config(state=tk.DISABLED)
+        self.reproducible_check.config(state=tk.DISABLED)
         self.app.logger.log(language_manager.get_text('stress_test_started').format(num_threads), "normal")
         
-        # Start performance monitoring thread
-        self.performance_thread = threading.Thread(target=self._performance_monitor, daemon=True)
-        self.performance_thread.start()
+        # Sample the counters on the Tk event loop, once per score interval
+        self._sample_after_id = self.after(self.score_interval * 1000, self._sample_scores)
 
     def stop_test(self):
         """Stop the stress test."""
@@ -226,39 +439,18 @@ class CPUStressTestWindow(tk.Toplevel):
             return
 
         self.testing = False
-        # Signal processes to stop
-        for ev in self.stop_events:
-            ev.set()
-        # Allow processes a brief moment to exit without blocking UI excessively
-        def _cleanup_processes(procs):
-            # Join with timeout slices to keep UI responsive
-            end_time = time.time() + 2  # 2s grace
-            for p in procs:
-                remaining = end_time - time.time()
-                if remaining <= 0:
-                    break
-                try:
-                    p.join(timeout=min(0.2, remaining))
-                except Exception:
-                    pass
-            # Terminate any stragglers
-            for p in procs:
-                if p.is_alive():
-                    try:
-                        p.terminate()
-                    except Exception:
-                        pass
-        threading.Thread(target=_cleanup_processes, args=(self.processes,), daemon=True).start()
-
-        self.processes.clear()
-        self.stop_events.clear()
-        self.counters.clear()
+        if self._sample_after_id is not None:
+            self.after_cancel(self._sample_after_id)
+            self._sample_after_id = None
+        # Workers return to the pool after their current batch
+        self._active_run.value = 0
+        self.active_workers = 0
         
         # Final score report
         if self.performance_scores:
-            avg_score = sum(self.performance_scores) / len(self.performance_scores)
-            max_score = max(self.performance_scores)
-            test_duration = time.time() - self.test_start_time
+            avg_score = self._score_sum / len(self.performance_scores)
+            max_score = self._score_max
+            test_duration = (time.monotonic_ns() - self.test_start_ns) // 1_000_000_000
             
             final_report = (
                 language_manager.get_text('stress_test_completed').format(
@@ -274,91 +466,132 @@ class CPUStressTestWindow(tk.Toplevel):
         self.start_button.config(state=tk.NORMAL)
         self.stop_button.config(state=tk.DISABLED)
         self.thread_combo.config(state=tk.NORMAL)
+        self.reproducible_check.config(state=tk.NORMAL)
+
+    def _sample_scores(self):
+        """Compute the score for the last interval and schedule the next sample.
+
+        Runs on the Tk event loop every score_interval seconds while testing.
+        """
+        self._sample_after_id = None
+        if not self.testing:
+            return
+        try:
+            current_ns = time.monotonic_ns()
+
+            # Aggregate operation counts from processes
+            total_ops = self._run_total_ops()
+
+            elapsed = (current_ns - self.last_ops_ns) / 1e9
+            ops_diff = max(0, total_ops - self.last_total_ops)
+            ops_per_sec = ops_diff / elapsed if elapsed > 0 else 0
+
+            # Score: Million Ops / second (MOp/s) of mixed workload
+            power_score = ops_per_sec / 1_000_000
+            if power_score > self.peak_score:
+                self.peak_score = power_score
+
+            # Track recent scores for sustainability (window of 5)
+            self.recent_scores.append(power_score)
+            if len(self.recent_scores) > 5:
+                self.recent_scores.pop(0)
+
+            self.last_total_ops = total_ops
+            self.last_ops_ns = current_ns
+
+            # Store raw ops_per_sec as basis for averages
+            self.performance_scores.append(power_score)
+            self._score_sum += power_score
+            if power_score > self._score_max:
+                self._score_max = power_score
+            if len(self.performance_scores) > 100:
+                removed = self.performance_scores.pop(0)
+                self._score_sum -= removed
+                if removed == self._score_max:
+                    self._score_max = max(self.performance_scores)
+
+            self._update_performance_display(power_score)
+        except Exception as e:
+            print(f"Performance monitoring error: {e}")
+        self._sample_after_id = self.after(self.score_interval * 1000, self._sample_scores)
 
-    def _performance_monitor(self):
-        """Performance monitoring thread."""
-        while self.testing:
-            try:
-                current_time = time.time()
-                if current_time - self.last_score_time >= self.score_interval:
-                    self.last_score_time = current_time
-
-                    # Aggregate operation counts from processes
-                    total_ops = 0
-                    for c in self.counters:
-                        try:
-                            with c.get_lock():
-                                total_ops += c.value
-                        except Exception:
-                            pass
-
-                    if self.last_ops_time is None:
-                        self.last_ops_time = current_time
-                        self.last_total_ops = total_ops
-                        continue
-
-                    elapsed = current_time - self.last_ops_time
-                    ops_diff = max(0, total_ops - self.last_total_ops)
-                    ops_per_sec = ops_diff / elapsed if elapsed > 0 else 0
-
-                    # Score: Million Ops / second (MOp/s) of mixed workload
-                    power_score = ops_per_sec / 1_000_000
-                    if power_score > self.peak_score:
-                        self.peak_score = power_score
-
-                    # Track recent scores for sustainability (window of 5)
-                    self.recent_scores.append(power_score)
-                    if len(self.recent_scores) > 5:
-                        self.recent_scores.pop(0)
-
-                    self.last_total_ops = total_ops
-                    self.last_ops_time = current_time
-
-                    # Store raw ops_per_sec as basis for averages
-                    self.performance_scores.append(power_score)
-                    if len(self.performance_scores) > 100:
-                        self.performance_scores.pop(0)
-
-                    self.after(0, self._update_performance_display, power_score)
-
-                time.sleep(0.2)
-            except Exception as e:
-                print(f"Performance monitoring error: {e}")
-                time.sleep(0.5)
-    
     def _update_performance_display(self, current_score):
-        """Update performance display."""
+        """Update performance display.
+
+        Labels are bound to StringVars, so Tk redraws them together at the next idle.
+        """
         if not self.winfo_exists() or not self.testing:
             return
         try:
             # Current score (Million Ops / second)
-            self.current_score_label.config(text=language_manager.get_text('current_cpu_score').format(current_score))
-            active_cores = max(1, len(self.processes))
+            self.current_score_var.set(self._t_current.format(current_score))
+            active_cores = max(1, self.active_workers)
             per_core = current_score / active_cores
-            self.per_core_label.config(text=language_manager.get_text('per_core_cpu_score').format(per_core))
+            self.per_core_var.set(self._t_per_core.format(per_core))
             # Average score
             if self.performance_scores:
-                avg_score = sum(self.performance_scores) / len(self.performance_scores)
-                self.avg_score_label.config(text=language_manager.get_text('average_cpu_score').format(avg_score))
+                avg_score = self._score_sum / len(self.performance_scores)
+                self.avg_score_var.set(self._t_average.format(avg_score))
                 # Max score
-                max_score = max(self.performance_scores)
-                self.max_score_label.config(text=language_manager.get_text('peak_cpu_score').format(max_score))
+                max_score = self._score_max
+                self.max_score_var.set(self._t_peak.format(max_score))
                 # Sustainability
                 if self.peak_score > 0 and self.recent_scores:
                     recent_avg = sum(self.recent_scores) / len(self.recent_scores)
                     sustain_pct = (recent_avg / self.peak_score) * 100
-                    self.sustain_label.config(text=language_manager.get_text('sustainability_value').format(sustain_pct))
+                    self.sustain_var.set(self._t_sustain.format(sustain_pct))
             # Test duration
-            if self.test_start_time:
-                elapsed = time.time() - self.test_start_time
+            if self.test_start_ns:
+                elapsed = (time.monotonic_ns() - self.test_start_ns) // 1_000_000_000
                 minutes = int(elapsed // 60)
                 seconds = int(elapsed % 60)
-                self.test_duration_label.config(text=language_manager.get_text('test_duration_label').format(minutes, seconds))
+                self.test_duration_var.set(self._t_duration.format(minutes, seconds))
         except Exception as e:
             print(f"Display update error: {e}")
 
+    def _create_pool(self):
+        """Create the worker pool and the shared objects its workers inherit."""
+        mp_ctx = mp.get_context("spawn")  # explicit for Windows compatibility
+        if self._active_run is None:
+            self._active_run = mp_ctx.RawValue('Q', 0)
+            # Per-worker 64-bit op counters; single writer per slot, so no lock is needed.
+            # Even and odd runs use separate halves, so a worker of the previous run
+            # finishing its last batch cannot write into a slot of the current run
+            self.op_counts = mp_ctx.RawArray('Q', 2 * self.cpu_count)
+        self._pool = ProcessPoolExecutor(max_workers=self.cpu_count, mp_context=mp_ctx,
+                                         initializer=_init_stress_worker,
+                                         initargs=(self._active_run, self.op_counts))
+
+    def _run_total_ops(self):
+        """Sum the op counters of the current run's half of op_counts."""
+        return sum(self.op_counts[self._slot_base:self._slot_base + self.cpu_count])
+
+    def _submit_worker(self, run, index, cpu_id, fastmath):
+        """Submit one worker loop, replacing the pool if a worker process died."""
+        try:
+            self._pool.submit(_process_stress_worker, run, index, cpu_id, fastmath)
+        except BrokenProcessPool:
+            self._pool.shutdown(wait=False)
+            self._create_pool()
+            self._pool.submit(_process_stress_worker, run, index, cpu_id, fastmath)
+
+    def _release_workers(self):
+        """Stop any running worker loop and shut the pool down without waiting."""
+        if self._active_run is not None:
+            self._active_run.value = 0
+        if self._pool is not None:
+            # Workers leave their loop after the current batch; do not block on them
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    def _on_destroy(self, event):
+        # Safety net for a destroy that bypasses on_close (e.g. the main window closing)
+        if event.widget is self:
+            self._release_workers()
+
     def on_close(self):
         """Handle window close event."""
         if self.testing:
             self.stop_test()
+        self._release_workers()
         self.destroy()
\ No newline at end of file
@@ -0,0 +1,29 @@
+"""
+Shared ttk style definitions for ResourceChecker windows.
+
+All named styles are registered once when the main window is built, so
+secondary windows only reference them instead of reconfiguring the theme
+every time they are opened.
+"""
+
+from tkinter import ttk
+
+
+# Style name -> configure() options
+NAMED_STYLES = {
+    # Resource & Temperature Monitor
+    "Monitor.TLabel": {"font": ("Helvetica", 12)},
+    "MonitorHeader.TLabel": {"font": ("Helvetica", 14, "bold")},
+    # System Specs
+    "SpecLabel.TLabel": {"font": ("Helvetica", 10, "bold")},
+    "SpecValue.TLabel": {"font": ("Helvetica", 10)},
+    "SpecHeader.TLabel": {"font": ("Helvetica", 11, "bold", "underline")},
+}
+
+
+def configure_styles(root) -> ttk.Style:
+    """Register all application styles on the given Tk root."""
+    style = ttk.Style(root)
+    for name, options in NAMED_STYLES.items():
+        style.configure(name, **options)
+    return style
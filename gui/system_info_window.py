@@ -9,23 +9,34 @@ from tkinter import ttk, messagebox
 from core.language import language_manager
 from core.system_info import SystemInfo
 
+# Single-value entries of SystemInfo.get_detailed_specs(), shown as loading until fetched
+_TEXT_SPEC_KEYS = ('os', 'cpu', 'ram', 'mobo', 'gpu', 'bios', 'uptime', 'ip', 'mac')
+
+
 class SystemSpecsWindow(tk.Toplevel):
     """Window to display detailed system specifications."""
 
-    def __init__(self, master):
+    def __init__(self, master, app):
         super().__init__(master)
         self.title(language_manager.get_text('system_specs_title'))
         self.geometry("700x700")
+        self.app = app
         
-        self.specs = SystemInfo.get_detailed_specs()
+        # Placeholders until the detailed specs (WMI on Windows) arrive
+        loading = language_manager.get_text('loading')
+        self.specs = {key: loading for key in _TEXT_SPEC_KEYS}
         self.public_ip_var = tk.StringVar(value="*****") # Default masked
+        self.public_ip_real_val = loading
+        self._public_ip_trace = None
         
         self.canvas = None
         self.main_frame = None
         self.text_content_data = {}
         
         self.setup_ui()
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
         self.start_public_ip_fetch()
+        threading.Thread(target=self._fetch_specs, daemon=True).start()
 
     def setup_ui(self):
         """Setup user interface with scrollable area."""
@@ -45,13 +56,66 @@ class SystemSpecsWindow(tk.Toplevel):
         self.canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
         
-        # Mousewheel scrolling
-        self.canvas.bind_all("<MouseWheel>", self._on_mousewheel)
+        # Mousewheel scrolling, only while the pointer is over this window.
+        # Enter/Leave of any child reach the Toplevel's bindtag too.
+        self.bind("<Enter>", self._bind_mousewheel)
+        self.bind("<Leave>", self._unbind_mousewheel)
+
+        self._populate_content()
 
+    def _fetch_specs(self):
+        """Collect the detailed specs off the Tk thread and hand them back to it."""
+        pythoncom = None
+        try:
+            import pythoncom  # WMI needs COM initialized on this thread (Windows only)
+            pythoncom.CoInitialize()
+        except ImportError:
+            pass
+        try:
+            specs = SystemInfo.get_detailed_specs()
+        except Exception as e:
+            # WMI/COM failures must not leave every field on "Loading..."
+            print(f"System specs error: {e}")
+            error = f"{language_manager.get_text('error')}: {e}"
+            specs = {key: error for key in _TEXT_SPEC_KEYS}
+        finally:
+            if pythoncom:
+                pythoncom.CoUninitialize()
+        self.app.post_to_gui(self._apply_specs, specs)
+
+    def _apply_specs(self, specs):
+        """Rebuild the window contents from the fetched specs."""
+        if not self.winfo_exists():
+            return
+        self.specs = specs
+        self.text_content_data.clear()
+        for child in self.scrollable_frame.winfo_children():
+            child.destroy()
         self._populate_content()
 
+    def _bind_mousewheel(self, event=None):
+        self.bind_all("<MouseWheel>", self._on_mousewheel)
+        # X11 reports the wheel as buttons 4/5
+        self.bind_all("<Button-4>", self._on_mousewheel)
+        self.bind_all("<Button-5>", self._on_mousewheel)
+
+    def _unbind_mousewheel(self, event=None):
+        self.unbind_all("<MouseWheel>")
+        self.unbind_all("<Button-4>")
+        self.unbind_all("<Button-5>")
+
     def _on_mousewheel(self, event):
-        self.canvas.yview_scroll(int(-1*(event.delta/120)), "units")
+        if event.num == 4:
+            delta = -1
+        elif event.num == 5:
+            delta = 1
+        else:
+            delta = int(-1*(event.delta/120))
+        self.canvas.yview_scroll(delta, "units")
+
+    def _on_close(self):
+        self._unbind_mousewheel()
+        self.destroy()
 
     def _populate_content(self):
         main_frame = self.scrollable_frame
@@ -60,72 +124,22 @@ class SystemSpecsWindow(tk.Toplevel):
         pad_frame = ttk.Frame(main_frame, padding="20")
         pad_frame.pack(fill="both", expand=True)
 
-        # Style
-        style = ttk.Style()
-        style.configure("SpecLabel.TLabel", font=("Helvetica", 10, "bold"))
-        style.configure("SpecValue.TLabel", font=("Helvetica", 10))
-        style.configure("Header.TLabel", font=("Helvetica", 11, "bold", "underline"))
-
-        row_idx = 0
-
-        # --- Section: Basic Info ---
-        basic_rows = [
-            ('lbl_os', 'os'),
-            ('lbl_processor', 'cpu'),
-            ('lbl_ram', 'ram'),
-            ('lbl_mobo', 'mobo'),
-            ('lbl_gpu', 'gpu'),
-            ('lbl_bios', 'bios'),
-            ('lbl_uptime', 'uptime'),
-        ]
+        # Spec*.TLabel styles are registered in gui.styles
 
-        for label_key, data_key in basic_rows:
-            self._add_row(pad_frame, row_idx, label_key, self.specs.get(data_key, "Unknown"))
-            row_idx += 1
-        
-        # --- Section: RAM Details ---
-        self._add_separator(pad_frame, row_idx)
-        row_idx += 1
-        self._add_header(pad_frame, row_idx, 'lbl_ram_detail')
-        row_idx += 1
-        
-        ram_details = self.specs.get('ram_detail', [])
-        if not ram_details:
-            self._add_row(pad_frame, row_idx, 'lbl_ram_detail', "N/A", header_mode=False)
-            row_idx += 1
-        else:
-            for rd in ram_details:
-                # Use a bullet point style
-                self._add_list_item(pad_frame, row_idx, rd)
-                row_idx += 1
-        # Store for copy
-        self.text_content_data[language_manager.get_text('lbl_ram_detail')] = "; ".join(ram_details)
-
-        # --- Section: Disk Details ---
-        self._add_separator(pad_frame, row_idx)
-        row_idx += 1
-        self._add_header(pad_frame, row_idx, 'lbl_disk_detail')
-        row_idx += 1
-        
-        # Physical
-        disk_details = self.specs.get('disk_detail', [])
-        if disk_details:
-            for dd in disk_details:
-                self._add_list_item(pad_frame, row_idx, f"Phys: {dd}")
-                row_idx += 1
-        # Logical
-        disk_parts = self.specs.get('disk', []) # Logical partitions
-        if disk_parts:
-            for dp in disk_parts:
-                self._add_list_item(pad_frame, row_idx, f"Vol: {dp}")
-                row_idx += 1
-        
-        self.text_content_data[language_manager.get_text('lbl_disk_detail')] = str(disk_details + disk_parts)
+        # Plain label/value rows live in one Treeview; only the masked rows below
+        # need widgets of their own (for the reveal button)
+        self.spec_tree = ttk.Treeview(pad_frame, columns=('value',), show='tree', selectmode='none')
+        self.spec_tree.column('#0', width=170, stretch=False)
+        self.spec_tree.column('value', width=470)
+        self.spec_tree.tag_configure('header', font=("Helvetica", 11, "bold", "underline"))
+        self.spec_tree.grid(row=0, column=0, columnspan=2, sticky='ew')
+        self._fill_spec_tree()
+        row_idx = 1
 
         # --- Section: Network Adapters ---
         self._add_separator(pad_frame, row_idx)
         row_idx += 1
-        self._add_header(pad_frame, row_idx, 'lbl_adapters')
+        self._add_section_header(pad_frame, row_idx, 'lbl_adapters')
         row_idx += 1
         
         adapters = self.specs.get('adapters', [])
@@ -139,7 +153,8 @@ class SystemSpecsWindow(tk.Toplevel):
             copy_str = "\n".join([f"{n}: {i}" for n, i in adapters])
             self.text_content_data[language_manager.get_text('lbl_adapters')] = copy_str
         else:
-             self._add_list_item(pad_frame, row_idx, "No adapters found")
+             ttk.Label(pad_frame, text="• No adapters found", style="SpecValue.TLabel").grid(
+                 row=row_idx, column=0, columnspan=2, sticky="w", padx=(20, 0))
              row_idx += 1
 
         # --- Section: IP / MAC ---
@@ -163,24 +178,70 @@ class SystemSpecsWindow(tk.Toplevel):
         copy_btn = ttk.Button(pad_frame, text=language_manager.get_text('btn_copy_clipboard'), command=self.copy_to_clipboard)
         copy_btn.grid(row=row_idx, column=0, columnspan=2, pady=(20, 0))
 
-    def _add_row(self, parent, row, label_key, value, header_mode=True):
-        label_text = language_manager.get_text(label_key) if header_mode else label_key
-        lbl = ttk.Label(parent, text=label_text, style="SpecLabel.TLabel")
-        lbl.grid(row=row, column=0, sticky="nw", pady=(0, 5))
+    def _fill_spec_tree(self):
+        """Fill the spec tree with the basic, RAM and disk sections."""
+        tree = self.spec_tree
+
+        # --- Section: Basic Info ---
+        basic_rows = [
+            ('lbl_os', 'os'),
+            ('lbl_processor', 'cpu'),
+            ('lbl_ram', 'ram'),
+            ('lbl_mobo', 'mobo'),
+            ('lbl_gpu', 'gpu'),
+            ('lbl_bios', 'bios'),
+            ('lbl_uptime', 'uptime'),
+        ]
+
+        for label_key, data_key in basic_rows:
+            self._add_row(label_key, self.specs.get(data_key, "Unknown"))
         
-        val_lbl = ttk.Label(parent, text=value, style="SpecValue.TLabel", wraplength=400)
-        val_lbl.grid(row=row, column=1, sticky="w", padx=(10, 0), pady=(0, 5))
+        # --- Section: RAM Details ---
+        self._add_header('lbl_ram_detail')
         
-        if header_mode:
-            self.text_content_data[label_text] = value
+        ram_details = self.specs.get('ram_detail', [])
+        if not ram_details:
+            self._add_list_item("N/A")
+        else:
+            for rd in ram_details:
+                # Use a bullet point style
+                self._add_list_item(rd)
+        # Store for copy
+        self.text_content_data[language_manager.get_text('lbl_ram_detail')] = "; ".join(ram_details)
 
-    def _add_header(self, parent, row, label_key):
-        lbl = ttk.Label(parent, text=language_manager.get_text(label_key), style="Header.TLabel")
-        lbl.grid(row=row, column=0, columnspan=2, sticky="w", pady=(10, 5))
+        # --- Section: Disk Details ---
+        self._add_header('lbl_disk_detail')
+        
+        # Physical
+        disk_details = self.specs.get('disk_detail', [])
+        for dd in disk_details:
+            self._add_list_item(f"Phys: {dd}")
+        # Logical
+        disk_parts = self.specs.get('disk', []) # Logical partitions
+        for dp in disk_parts:
+            self._add_list_item(f"Vol: {dp}")
+        
+        self.text_content_data[language_manager.get_text('lbl_disk_detail')] = str(disk_details + disk_parts)
+
+        # Show every row; the window itself scrolls
+        tree.configure(height=len(tree.get_children()))
+
+    def _add_row(self, label_key, value):
+        label_text = language_manager.get_text(label_key)
+        self.spec_tree.insert('', 'end', text=label_text, values=(value,))
+        self.text_content_data[label_text] = value
+
+    def _add_header(self, label_key):
+        # Blank spacer row in place of a separator
+        self.spec_tree.insert('', 'end', text='', values=('',))
+        self.spec_tree.insert('', 'end', text=language_manager.get_text(label_key), values=('',), tags=('header',))
 
-    def _add_list_item(self, parent, row, text):
-        lbl = ttk.Label(parent, text="• " + text, style="SpecValue.TLabel", wraplength=550)
-        lbl.grid(row=row, column=0, columnspan=2, sticky="w", padx=(20, 0))
+    def _add_list_item(self, text):
+        self.spec_tree.insert('', 'end', text='', values=("• " + text,))
+
+    def _add_section_header(self, parent, row, label_key):
+        lbl = ttk.Label(parent, text=language_manager.get_text(label_key), style="SpecHeader.TLabel")
+        lbl.grid(row=row, column=0, columnspan=2, sticky="w", pady=(10, 5))
 
     def _add_separator(self, parent, row):
         ttk.Separator(parent, orient='horizontal').grid(row=row, column=0, columnspan=2, sticky='ew', pady=10)
@@ -229,8 +290,6 @@ class SystemSpecsWindow(tk.Toplevel):
         # We will use 'var' as the source of truth, but display a separate masked var
         # Actually easier: The var passed IS the masked one? No, var is the REAL value holder.
         
-        self.public_ip_real_val = language_manager.get_text('loading') # Initial
-        
         display_var = tk.StringVar(value="*****")
         val_lbl = ttk.Label(val_frame, textvariable=display_var, style="SpecValue.TLabel")
         val_lbl.pack(side=tk.LEFT)
@@ -248,7 +307,10 @@ class SystemSpecsWindow(tk.Toplevel):
              if display_var.get() != "*****":
                  display_var.set(self.public_ip_real_val)
 
-        var.trace_add("write", on_real_val_change)
+        # The row is rebuilt once the detailed specs arrive; drop the old row's trace
+        if self._public_ip_trace is not None:
+            var.trace_remove("write", self._public_ip_trace)
+        self._public_ip_trace = var.trace_add("write", on_real_val_change)
 
         btn = ttk.Button(val_frame, text="👁️‍🗨️", width=3, command=toggle_view)
         btn.pack(side=tk.LEFT, padx=(10, 0))
@@ -1,27 +1,39 @@
 """Webhook settings window implementation."""
 
+import re
+import threading
+import time
 import tkinter as tk
 from tkinter import ttk, messagebox
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from core.network import WebhookNotifier
 from core.language import language_manager
 
+MAX_NAME_LENGTH = 64
+_URL_RE = re.compile(r'^https?://[^\s<>"\'`]{1,2048}$')
+# NUL, LF and CR, removed from form fields before validation
+_STRIP_CONTROL = {0: None, 10: None, 13: None}
+
 
 class WebhookSettingsWindow(tk.Toplevel):
     """Window for managing webhook configurations."""
 
-    def __init__(self, master, webhook_config, webhook_notifier: WebhookNotifier | None = None):
+    def __init__(self, master, app, webhook_config, webhook_notifier: WebhookNotifier | None = None):
         super().__init__(master)
         self.title(language_manager.get_text('webhook_window_title'))
         self.geometry("820x460")
         self.resizable(False, False)
+        self.app = app
         self.webhook_config = webhook_config
         self.webhook_notifier = webhook_notifier or WebhookNotifier(self.webhook_config)
         self._editing_name = None  # Track which webhook is being edited
         self._mode = "add"  # 'add' or 'edit'
+        # Mode label texts, set on every selection / form reset
+        self._mode_add_text = language_manager.get_text('mode_add_new')
+        self._mode_editing_fmt = language_manager.get_text('mode_editing')
 
         self._build_ui()
-        self._populate_tree()
+        self._refresh_tree()
 
     # UI -----------------------------------------------------------------
     def _build_ui(self):
@@ -51,7 +63,7 @@ class WebhookSettingsWindow(tk.Toplevel):
         self.threshold_entry.grid(row=2, column=1, sticky=tk.W, pady=2)
 
         # Mode indicator
-        self.mode_label = ttk.Label(self, text=language_manager.get_text('mode_add_new'), padding=(12, 2))
+        self.mode_label = ttk.Label(self, text=self._mode_add_text, padding=(12, 2))
         self.mode_label.pack(anchor=tk.W)
 
         btn_frame = ttk.Frame(self, padding=(10, 0, 10, 5))
@@ -96,59 +108,89 @@ class WebhookSettingsWindow(tk.Toplevel):
             self.threshold_entry.config(state="disabled")
 
     # Data ops ------------------------------------------------------------
-    def _populate_tree(self):
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        for name, cfg in self.webhook_config.webhooks.items():
-            self.tree.insert(
-                "",
-                tk.END,
-                values=(
-                    name,
-                    cfg['url'],
-                    cfg['type'],
-                    "Yes" if cfg['active'] else "No",
-                    cfg.get('threshold') if cfg.get('threshold') is not None else "-"
-                )
-            )
+    @staticmethod
+    def _row_values(name, cfg):
+        threshold = cfg.get('threshold')
+        return (
+            name,
+            cfg['url'],
+            cfg['type'],
+            "Yes" if cfg['active'] else "No",
+            threshold if threshold is not None else "-"
+        )
 
-    def add_webhook(self):
-        name = self.name_var.get().strip()
-        url = self.url_var.get().strip()
+    def _refresh_tree(self):
+        """Bring the tree in line with the config, touching only rows that differ.
+
+        Row iids are the webhook names.
+        """
+        # Snapshot so the loop is unaffected if the config changes meanwhile
+        items = tuple(self.webhook_config.webhooks.items())
+        current = set(self.tree.get_children())
+        stale = current.difference(name for name, _ in items)
+        if stale:
+            self.tree.delete(*stale)
+        for name, cfg in items:
+            self._set_row(name, cfg, name in current)
+
+    def _set_row(self, name, cfg, exists=None):
+        """Insert or update the row of one webhook."""
+        if exists is None:
+            exists = self.tree.exists(name)
+        values = self._row_values(name, cfg)
+        if exists:
+            self.tree.item(name, values=values)
+        else:
+            self.tree.insert("", tk.END, iid=name, values=values)
+
+    def _validate_form(self):
+        """Read and check the form; returns (name, url, wtype, active, threshold) or None after warning.
+
+        Every form variable is read exactly once, here.
+        """
+        name = self.name_var.get().translate(_STRIP_CONTROL).strip()
+        url = self.url_var.get().translate(_STRIP_CONTROL).strip()
         wtype = self.type_var.get()
+        active = self.active_var.get()
+        raw_threshold = self.threshold_var.get()
         if not name or not url:
             messagebox.showwarning(language_manager.get_text('validation_title'), language_manager.get_text('validation_name_url_required'))
-            return
-        if name in self.webhook_config.webhooks:
-            messagebox.showerror(language_manager.get_text('duplicate_title'), language_manager.get_text('duplicate_exists').format(name))
-            return
+            return None
+        if len(name) > MAX_NAME_LENGTH:
+            messagebox.showwarning(language_manager.get_text('validation_title'), language_manager.get_text('validation_name_too_long').format(MAX_NAME_LENGTH))
+            return None
+        # Reject malformed URLs here rather than after a send timeout
+        if not _URL_RE.match(url):
+            messagebox.showwarning(language_manager.get_text('validation_title'), language_manager.get_text('validation_invalid_url'))
+            return None
         threshold = None
         if wtype == "cpu":
             try:
-                threshold = float(self.threshold_var.get())
+                threshold = float(raw_threshold)
             except ValueError:
                 messagebox.showerror(language_manager.get_text('validation_title'), language_manager.get_text('threshold_number_error'))
-                return
-        self.webhook_config.add_webhook(name, url, wtype, self.active_var.get(), threshold)
-        self._populate_tree()
+                return None
+        return name, url, wtype, active, threshold
+
+    def add_webhook(self):
+        form = self._validate_form()
+        if form is None:
+            return
+        name, url, wtype, active, threshold = form
+        if name in self.webhook_config.webhooks:
+            messagebox.showerror(language_manager.get_text('duplicate_title'), language_manager.get_text('duplicate_exists').format(name))
+            return
+        self.webhook_config.add_webhook(name, url, wtype, active, threshold)
+        self._set_row(name, self.webhook_config.webhooks[name], exists=False)
         self._clear_form(clear_name=True)
 
     def update_webhook(self):
         if not self._editing_name:
             return
-        name = self.name_var.get().strip()
-        url = self.url_var.get().strip()
-        wtype = self.type_var.get()
-        if not name or not url:
-            messagebox.showwarning(language_manager.get_text('validation_title'), language_manager.get_text('validation_name_url_required'))
+        form = self._validate_form()
+        if form is None:
             return
-        threshold = None
-        if wtype == "cpu":
-            try:
-                threshold = float(self.threshold_var.get())
-            except ValueError:
-                messagebox.showerror(language_manager.get_text('validation_title'), language_manager.get_text('threshold_number_error'))
-                return
+        name, url, wtype, active, threshold = form
         # Handle rename
         if name != self._editing_name and name in self.webhook_config.webhooks:
             messagebox.showerror(language_manager.get_text('duplicate_title'), language_manager.get_text('duplicate_rename_error').format(name))
@@ -156,9 +198,11 @@ class WebhookSettingsWindow(tk.Toplevel):
         # Remove old if renamed
         if name != self._editing_name:
             self.webhook_config.remove_webhook(self._editing_name)
-        self.webhook_config.add_webhook(name, url, wtype, self.active_var.get(), threshold)
+            if self.tree.exists(self._editing_name):
+                self.tree.delete(self._editing_name)
+        self.webhook_config.add_webhook(name, url, wtype, active, threshold)
         self._editing_name = name
-        self._populate_tree()
+        self._set_row(name, self.webhook_config.webhooks[name])
         self._set_edit_mode(name)
 
     def remove_selected(self):
@@ -168,7 +212,7 @@ class WebhookSettingsWindow(tk.Toplevel):
         for item in selected:
             name = self.tree.item(item, "values")[0]
             self.webhook_config.remove_webhook(name)
-        self._populate_tree()
+        self.tree.delete(*selected)
         self._clear_form(clear_name=True)
 
     # Helpers ------------------------------------------------------------
@@ -182,7 +226,7 @@ class WebhookSettingsWindow(tk.Toplevel):
         self._on_type_change()
         self._editing_name = None
         self._mode = "add"
-        self.mode_label.config(text=language_manager.get_text('mode_add_new'))
+        self.mode_label.config(text=self._mode_add_text)
         self.save_btn.config(state=tk.DISABLED)
         self.add_btn.config(state=tk.NORMAL)
         self.cancel_btn.config(state=tk.DISABLED)
@@ -207,7 +251,7 @@ class WebhookSettingsWindow(tk.Toplevel):
     def _set_edit_mode(self, name: str):
         self._editing_name = name
         self._mode = "edit"
-        self.mode_label.config(text=language_manager.get_text('mode_editing').format(name))
+        self.mode_label.config(text=self._mode_editing_fmt.format(name))
         self.save_btn.config(state=tk.NORMAL)
         self.add_btn.config(state=tk.DISABLED)
         self.cancel_btn.config(state=tk.NORMAL)
@@ -224,7 +268,7 @@ class WebhookSettingsWindow(tk.Toplevel):
             return
         new_active = not cfg['active']
         self.webhook_config.update_webhook_status(name, new_active)
-        self._populate_tree()
+        self._set_row(name, cfg, exists=True)
 
     # Test sending -------------------------------------------------------
     def test_selected(self):
@@ -232,24 +276,50 @@ class WebhookSettingsWindow(tk.Toplevel):
         if not sel:
             messagebox.showinfo(language_manager.get_text('test_title'), language_manager.get_text('test_select_warning'))
             return
-        sent = 0
-        failed = 0
+        # Build every message here; only the sends run off the Tk thread
+        title = language_manager.get_text('test_message_title')
+        timestamp = time.strftime('%Y-%m-%d %H:%M:%S')
+        jobs = []
         for item in sel:
-            name, url, wtype, active, threshold = self.tree.item(item, "values")
-            # Ignore inactive
+            name = self.tree.item(item, "values")[0]
             cfg = self.webhook_config.webhooks.get(name)
             if not cfg:
                 continue
-            title = language_manager.get_text('test_message_title')
             msg = language_manager.get_text('test_message_body').format(
                 name,
                 cfg['type'],
                 cfg['active'],
-                datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+                timestamp
             )
-            ok = self.webhook_notifier.send_teams_message(cfg['url'], title, msg, color="0078D7")
-            if ok:
-                sent += 1
-            else:
-                failed += 1
-        messagebox.showinfo(language_manager.get_text('test_results_title'), language_manager.get_text('test_results_message').format(sent, failed))
\ No newline at end of file
+            jobs.append((cfg['url'], msg))
+        if not jobs:
+            self._on_tests_sent(0, 0)
+            return
+        self.test_btn.config(state=tk.DISABLED)
+        threading.Thread(target=self._send_tests, args=(title, jobs), daemon=True).start()
+
+    def _send_tests(self, title, jobs):
+        """Send all test messages in parallel (worker thread)."""
+        sent = 0
+        failed = 0
+        with ThreadPoolExecutor(max_workers=min(16, len(jobs))) as executor:
+            futures = [
+                executor.submit(self.webhook_notifier.send_teams_message, url, title, msg, color="0078D7")
+                for url, msg in jobs
+            ]
+            for future in as_completed(futures):
+                try:
+                    ok = future.result()
+                except Exception:
+                    ok = False
+                if ok:
+                    sent += 1
+                else:
+                    failed += 1
+        self.app.post_to_gui(self._on_tests_sent, sent, failed)
+
+    def _on_tests_sent(self, sent, failed):
+        if not self.winfo_exists():
+            return
+        self.test_btn.config(state=tk.NORMAL)
+        messagebox.showinfo(language_manager.get_text('test_results_title'), language_manager.get_text('test_results_message').format(sent, failed))
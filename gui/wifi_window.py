@@ -5,19 +5,62 @@ Displays real-time and scanned Wi-Fi network information.
 
 import tkinter as tk
 from tkinter import ttk, messagebox
+import queue
 import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from core.language import language_manager
 from core.wifi_analyzer import WifiAnalyzer
 
+# Signal strength colors: strong, medium, weak
+_SIGNAL_COLORS = ("green", "#D4AF37", "red")
+
+
 class WifiWindow(tk.Toplevel):
-    def __init__(self, master):
+    PROFILE_CACHE_TTL = 300
+    SCAN_INSERT_CHUNK = 20  # scan rows inserted per event loop turn
+    HELPER_THREADS = 8  # parallel netsh lookups during an export
+
+    def __init__(self, master, app):
         super().__init__(master)
         self.title(language_manager.get_text('wifi_title'))
         self.geometry("900x600")
+        self.app = app
+        # Texts reused on every refresh
+        self._loading_text = language_manager.get_text('loading')
+        self._disconnected_text = language_manager.get_text('wifi_disconnected')
+        # Saved profile lookups (one netsh call each), reused for PROFILE_CACHE_TTL seconds
+        self._profile_cache = {}  # ssid -> (time.monotonic(), details)
+        self._profiles_cache = None  # (time.monotonic(), profile names)
+        self._scan_in_flight = False  # One scan at a time; extra refresh calls are dropped
+        # Last applied scan, to skip redrawing when a refresh changes nothing
+        self._last_current = None
+        self._last_scan_rows = None
+        # One long-lived worker runs all netsh jobs in order; None stops it
+        self._work_q = queue.Queue()
+        threading.Thread(target=self._worker_loop, daemon=True).start()
+        # Helper threads for netsh calls a job runs side by side (scan, export lookups);
+        # created on demand and kept for the window's life
+        self._helper_pool = ThreadPoolExecutor(max_workers=self.HELPER_THREADS, thread_name_prefix='wifi-helper')
         
         self.setup_ui()
         self.refresh_data()
 
+    def _worker_loop(self):
+        while True:
+            job = self._work_q.get()
+            if job is None:
+                break
+            try:
+                job()
+            except Exception as e:
+                print(f"Wi-Fi task error: {e}")
+
+    def destroy(self):
+        self._work_q.put(None)
+        self._helper_pool.shutdown(wait=False, cancel_futures=True)
+        super().destroy()
+
     def setup_ui(self):
         # Notebook
         self.notebook = ttk.Notebook(self)
@@ -25,6 +68,7 @@ class WifiWindow(tk.Toplevel):
 
         self._setup_live_tab()
         self._setup_saved_tab()
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
 
     def _setup_live_tab(self):
         tab = ttk.Frame(self.notebook, padding=10)
@@ -82,6 +126,10 @@ class WifiWindow(tk.Toplevel):
         self.tree.column('radio', width=80)
         self.tree.column('auth', width=120)
         self.tree.column('bssid', width=120)
+
+        # Color scan rows by the signal class _update_ui tags them with
+        for tag, color in zip(('high_sig', 'med_sig', 'low_sig'), _SIGNAL_COLORS):
+            self.tree.tag_configure(tag, foreground=color)
         
         scrollbar = ttk.Scrollbar(bottom_frame, orient=tk.VERTICAL, command=self.tree.yview)
         self.tree.configure(yscroll=scrollbar.set)
@@ -90,8 +138,18 @@ class WifiWindow(tk.Toplevel):
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
     def _setup_saved_tab(self):
-        tab = ttk.Frame(self.notebook, padding=10)
-        self.notebook.add(tab, text=language_manager.get_text('tab_saved_wifi'))
+        # Contents are built on first visit (_on_tab_changed); most opens never show this tab
+        self._saved_tab = ttk.Frame(self.notebook, padding=10)
+        self._saved_tab_built = False
+        self.notebook.add(self._saved_tab, text=language_manager.get_text('tab_saved_wifi'))
+
+    def _on_tab_changed(self, event=None):
+        if not self._saved_tab_built and self.notebook.select() == str(self._saved_tab):
+            self._saved_tab_built = True
+            self._build_saved_tab()
+
+    def _build_saved_tab(self):
+        tab = self._saved_tab
         
         # Controls
         ctrl_frame = ttk.Frame(tab)
@@ -135,17 +193,66 @@ class WifiWindow(tk.Toplevel):
             self.current_labels[val_key + '_color'] = True
 
     def refresh_data(self):
+        if self._scan_in_flight:
+            return
+        self._scan_in_flight = True
         self.refresh_btn.config(state='disabled')
-        self.status_lbl.config(text=language_manager.get_text('loading'))
-        threading.Thread(target=self._fetch_and_update, daemon=True).start()
+        self.status_lbl.config(text=self._loading_text)
+        self._work_q.put(self._fetch_and_update)
 
     def _fetch_and_update(self):
-        current = WifiAnalyzer.get_current_interface_info()
-        networks = WifiAnalyzer.scan_networks()
-        self.after(0, self._update_ui, current, networks)
+        try:
+            # The two netsh calls are independent: scan on the helper thread meanwhile
+            scan = self._helper_pool.submit(WifiAnalyzer.scan_networks)
+            current = WifiAnalyzer.get_current_interface_info()
+            networks = scan.result()
+        except Exception as e:
+            print(f"Wi-Fi refresh error: {e}")
+            # Otherwise the Refresh button would stay disabled for good
+            self._post(self._on_refresh_failed, str(e))
+            return
+        self._post(self._update_ui, current, networks)
+
+    def _post(self, callback, *args):
+        """Hand callback(*args) to the Tk thread; safe from any thread, no Tk call here."""
+        self.app.post_to_gui(self._run_if_open, callback, args)
+
+    def _run_if_open(self, callback, args):
+        # The window may have closed while the netsh job ran
+        if self.winfo_exists():
+            callback(*args)
+
+    def _on_refresh_failed(self, error):
+        self._finish_refresh(f"{language_manager.get_text('error')}: {error}")
 
     def _update_ui(self, current, networks):
-        # Update Current Section
+        # Update Current Section (skipped when the interface info is unchanged)
+        if current != self._last_current:
+            self._last_current = current
+            self._update_current(current)
+
+        # Update Live Tree
+        rows = []
+        for net in networks:
+            sig = net.get('signal', '0')
+            try:
+                strength = int(sig)
+            except (TypeError, ValueError):
+                strength = 0
+            tags = ('high_sig',) if strength > 70 else ('med_sig',) if strength > 40 else ('low_sig',)
+            rows.append(((
+                net.get('ssid', ''), f"{sig}%", net.get('channel', ''),
+                net.get('radio', ''), net.get('auth', ''), net.get('mac', '')
+            ), tags))
+        if rows == self._last_scan_rows:
+            # Same networks with the same signals: keep the rows already shown
+            self._finish_refresh()
+            return
+        self._last_scan_rows = rows
+        self.tree.delete(*self.tree.get_children())
+        self._insert_network_rows(rows, 0)
+
+    def _update_current(self, current):
         if current and 'ssid' in current:
             self.current_labels['ssid_val'].config(text=current.get('ssid', 'Unknown'))
             self.current_labels['bssid_val'].config(text=current.get('bssid', 'Unknown'))
@@ -157,45 +264,67 @@ class WifiWindow(tk.Toplevel):
             self._colorize_signal(self.current_labels['signal_val'], sig)
             self.current_labels['auth_val'].config(text=current.get('state', 'Connected'))
         else:
-            self.current_labels['ssid_val'].config(text=language_manager.get_text('wifi_disconnected'))
+            self.current_labels['ssid_val'].config(text=self._disconnected_text)
             for k, lbl in self.current_labels.items():
                 if "_color" not in k and lbl != self.current_labels['ssid_val']:
                     lbl.config(text="--")
 
-        # Update Live Tree
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-            
-        for net in networks:
-            sig = net.get('signal', '0')
-            tags = ('high_sig',) if int(sig) > 70 else ('med_sig',) if int(sig) > 40 else ('low_sig',)
-            self.tree.insert('', 'end', values=(
-                net.get('ssid', ''), f"{sig}%", net.get('channel', ''),
-                net.get('radio', ''), net.get('auth', ''), net.get('mac', '')
-            ), tags=tags)
-            
-        self.status_lbl.config(text="")
+    def _insert_network_rows(self, rows, start):
+        """Insert scan rows a chunk at a time so large scans don't stall the event loop."""
+        if not self.winfo_exists():
+            return
+        end = start + self.SCAN_INSERT_CHUNK
+        for values, tags in rows[start:end]:
+            self.tree.insert('', 'end', values=values, tags=tags)
+        if end < len(rows):
+            self.after(1, self._insert_network_rows, rows, end)
+            return
+        self._finish_refresh()
+
+    def _finish_refresh(self, status=""):
+        """Clear the loading state and allow the next refresh."""
+        self.status_lbl.config(text=status)
         self.refresh_btn.config(state='normal')
+        self._scan_in_flight = False
 
     def _colorize_signal(self, label, signal_str):
         try:
             val = int(signal_str)
-            label.config(foreground="green" if val >= 80 else "#D4AF37" if val >= 50 else "red")
-        except:
+        except (TypeError, ValueError):
             label.config(foreground="black")
+            return
+        strong, medium, weak = _SIGNAL_COLORS
+        label.config(foreground=strong if val >= 80 else medium if val >= 50 else weak)
 
     # --- Saved Networks Logic ---
+    def _get_saved_profiles_cached(self):
+        hit = self._profiles_cache
+        now = time.monotonic()
+        if hit and now - hit[0] < self.PROFILE_CACHE_TTL:
+            return hit[1]
+        profiles = WifiAnalyzer.get_saved_profiles()
+        self._profiles_cache = (now, profiles)
+        return profiles
+
+    def _get_details_cached(self, ssid):
+        hit = self._profile_cache.get(ssid)
+        now = time.monotonic()
+        if hit and now - hit[0] < self.PROFILE_CACHE_TTL:
+            return hit[1]
+        details = WifiAnalyzer.get_profile_details(ssid)
+        self._profile_cache[ssid] = (now, details)
+        return details
+
     def load_saved_profiles(self):
-        self.saved_status.config(text=language_manager.get_text('loading'))
-        for item in self.saved_tree.get_children():
-            self.saved_tree.delete(item)
+        self.saved_status.config(text=self._loading_text)
+        self.saved_tree.delete(*self.saved_tree.get_children())
             
-        threading.Thread(target=self._fetch_saved_profiles_thread, daemon=True).start()
+        self._work_q.put(self._fetch_saved_profiles_thread)
 
     def _fetch_saved_profiles_thread(self):
         # Only fetch list first
-        profiles = WifiAnalyzer.get_saved_profiles()
-        self.after(0, self._populate_saved_tree, profiles)
+        profiles = self._get_saved_profiles_cached()
+        self._post(self._populate_saved_tree, profiles)
 
     def _populate_saved_tree(self, profiles):
         for p in profiles:
@@ -213,8 +342,8 @@ class WifiWindow(tk.Toplevel):
         
         # Async fetch details
         def fetch():
-            details = WifiAnalyzer.get_profile_details(ssid)
-            self.after(0, update_row, item, details)
+            details = self._get_details_cached(ssid)
+            self._post(update_row, item, details)
             
         def update_row(item_id, details):
             # Update the row with fetched details
@@ -225,7 +354,7 @@ class WifiWindow(tk.Toplevel):
                 details.get('connection_mode', 'Unknown')
             ))
             
-        threading.Thread(target=fetch, daemon=True).start()
+        self._work_q.put(fetch)
 
     def delete_selected_profile(self):
         sel = self.saved_tree.selection()
@@ -234,6 +363,8 @@ class WifiWindow(tk.Toplevel):
         
         if messagebox.askyesno("Delete Profile", f"Delete Wi-Fi profile '{ssid}'?"):
             if WifiAnalyzer.delete_profile(ssid):
+                self._profile_cache.pop(ssid, None)
+                self._profiles_cache = None
                 self.saved_tree.delete(sel[0])
                 messagebox.showinfo("Success", "Profile deleted.")
             else:
@@ -245,18 +376,21 @@ class WifiWindow(tk.Toplevel):
             return
             
         def run_export():
-            profiles = WifiAnalyzer.get_saved_profiles()
-            lines = []
-            for p in profiles:
-                d = WifiAnalyzer.get_profile_details(p)
-                line = f"SSID: {d['ssid']} | Pass: {d.get('password', 'N/A')} | Auth: {d.get('auth', 'N/A')}"
-                lines.append(line)
-            
+            profiles = self._get_saved_profiles_cached()
+            total = len(profiles)
             try:
-                with open("wifi_passwords_export.txt", "w", encoding='utf-8') as f:
-                    f.write("\n".join(lines))
-                self.after(0, lambda: messagebox.showinfo("Export", "Saved to wifi_passwords_export.txt"))
+                # Stream each line out as its details arrive instead of joining them all first
+                with open("wifi_passwords_export.txt", "w", encoding='utf-8', buffering=64 * 1024) as f:
+                    # Each lookup is its own netsh call; map runs them side by side in profile order
+                    details = self._helper_pool.map(self._get_details_cached, profiles)
+                    for done, d in enumerate(details, 1):
+                        f.write(f"SSID: {d['ssid']} | Pass: {d.get('password', 'N/A')} | Auth: {d.get('auth', 'N/A')}\n")
+                        if done % 10 == 0:
+                            self._post(self.saved_status.config, {'text': f"{done}/{total}"})
+                self._post(messagebox.showinfo, "Export", "Saved to wifi_passwords_export.txt")
             except Exception as e:
-                self.after(0, lambda: messagebox.showerror("Export Error", str(e)))
+                self._post(messagebox.showerror, "Export Error", str(e))
+            finally:
+                self._post(self.saved_status.config, {'text': ""})
 
-        threading.Thread(target=run_export, daemon=True).start()
+        self._work_q.put(run_export)
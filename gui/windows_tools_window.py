@@ -4,22 +4,79 @@ Provides shortcuts to system tools and a command console.
 """
 
 import tkinter as tk
-from tkinter import ttk, scrolledtext
+from tkinter import ttk
 import threading
+from functools import partial
+import queue
 from core.language import language_manager
 from core.windows_utils import WindowsUtils
+from core.command_library import COMMAND_CATEGORIES
 
 from gui.path_editor_window import PathEditorWindow
 from tkinter import messagebox
 
+# (label key, WindowsUtils.TOOLS key) for the shortcuts grid
+_SHORTCUT_TOOLS = (
+    # Original
+    ('tool_task_mgr', 'task_mgr'),
+    ('tool_dev_mgmt', 'dev_mgmt'),
+    ('tool_disk_mgmt', 'disk_mgmt'),
+    ('tool_services', 'services'),
+    ('tool_event_vwr', 'event_vwr'),
+    ('tool_dxdiag', 'dxdiag'),
+    # New
+    ('tool_renew_ip_p', 'cmd_renew_ip_p'),
+    ('tool_sys_prop', 'sys_prop'),
+    ('tool_regedit', 'regedit'),
+    ('tool_control', 'control'),
+    ('tool_add_remove', 'add_remove'),
+    ('tool_firewall', 'firewall'),
+    ('tool_hosts', 'hosts_file'),
+    ('tool_msinfo', 'msinfo'),
+    ('tool_cmd', 'cmd'),
+    ('tool_powershell', 'powershell'),
+)
+
+# (category, lang) -> [(name, cmd, desc), ...]; the library is static, so
+# each list is built once and reused on every category switch
+_CATEGORY_ROWS_CACHE = {}
+
+# Queued after a command's output to tell the poll that the run has finished
+_RUN_DONE = object()
+
+
+def _category_rows(cat, lang):
+    key = (cat, lang)
+    rows = _CATEGORY_ROWS_CACHE.get(key)
+    if rows is None:
+        desc_key = 'desc_tr' if lang == 'tr' else 'desc'
+        rows = [(c.get('name', ''), c.get('cmd', ''), c.get(desc_key) or c.get('desc', ''))
+                for c in COMMAND_CATEGORIES.get(cat, [])]
+        _CATEGORY_ROWS_CACHE[key] = rows
+    return rows
+
 class WindowsToolsWindow(tk.Toplevel):
+    OUTPUT_FLUSH_MS = 50
+    # Rolling scrollback cap; a Text widget slows down as it grows
+    MAX_OUTPUT_LINES = 5000
+
     def __init__(self, master):
         super().__init__(master)
         self.title(language_manager.get_text('win_tools_title'))
         self.geometry("800x650") # Increased size
         
+        # Command output is queued by the worker thread and drained on a timer,
+        # so chatty commands cost one Text insert per OUTPUT_FLUSH_MS
+        self._out_q = queue.Queue()
+
         self.setup_ui()
         self.path_editor = None
+        self._poll_after_id = None  # Output poll; started with the console tab
+
+    def destroy(self):
+        if self._poll_after_id is not None:
+            self.after_cancel(self._poll_after_id)
+        super().destroy()
 
     def setup_ui(self):
         # Notebook for Tabs
@@ -28,6 +85,7 @@ class WindowsToolsWindow(tk.Toplevel):
 
         self._setup_shortcuts_tab()
         self._setup_console_tab()
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
 
     def _setup_shortcuts_tab(self):
         tab = ttk.Frame(self.notebook, padding=20)
@@ -47,44 +105,18 @@ class WindowsToolsWindow(tk.Toplevel):
         grid_frame = ttk.LabelFrame(tab, text="System Shortcuts", padding=10)
         grid_frame.pack(fill=tk.BOTH, expand=True)
 
-        tools = [
-            # Original
-            ('tool_task_mgr', 'task_mgr'),
-            ('tool_dev_mgmt', 'dev_mgmt'),
-            ('tool_disk_mgmt', 'disk_mgmt'),
-            ('tool_services', 'services'),
-            ('tool_event_vwr', 'event_vwr'),
-            ('tool_dxdiag', 'dxdiag'),
-            # New
-            ('tool_renew_ip_p', 'cmd_renew_ip_p'),
-            ('tool_sys_prop', 'sys_prop'),
-            ('tool_regedit', 'regedit'),
-            ('tool_control', 'control'),
-            ('tool_add_remove', 'add_remove'),
-            ('tool_firewall', 'firewall'),
-            ('tool_hosts', 'hosts_file'),
-            ('tool_msinfo', 'msinfo'),
-            ('tool_cmd', 'cmd'),
-            ('tool_powershell', 'powershell')
-        ]
-
-        row = 0
-        col = 0
         cols_per_row = 3
+        get_text = language_manager.get_text
         
-        for label_key, tool_key in tools:
-            btn = ttk.Button(
+        # Grid only records placement; Tk lays the frame out once at idle
+        for i, (label_key, tool_key) in enumerate(_SHORTCUT_TOOLS):
+            row, col = divmod(i, cols_per_row)
+            ttk.Button(
                 grid_frame, 
-                text=language_manager.get_text(label_key),
-                command=lambda k=tool_key: WindowsUtils.launch_tool(k),
+                text=get_text(label_key),
+                command=partial(WindowsUtils.launch_tool, tool_key),
                 width=30
-            )
-            btn.grid(row=row, column=col, padx=10, pady=5)
-            
-            col += 1
-            if col >= cols_per_row:
-                col = 0
-                row += 1
+            ).grid(row=row, column=col, padx=10, pady=5)
 
     def run_temp_clean(self):
         if messagebox.askyesno("Confirm", language_manager.get_text('msg_confirm_clean')):
@@ -92,14 +124,30 @@ class WindowsToolsWindow(tk.Toplevel):
             messagebox.showinfo("Result", result + "\n\n" + language_manager.get_text('msg_clean_complete'))
 
     def open_path_editor(self):
-        if self.path_editor is None or not self.path_editor.winfo_exists():
+        if self.path_editor is None:
             self.path_editor = PathEditorWindow(self)
+            self.path_editor.bind('<Destroy>', self._on_path_editor_destroy, add='+')
         else:
             self.path_editor.lift()
 
+    def _on_path_editor_destroy(self, event):
+        # <Destroy> also fires for every child widget of the editor
+        if event.widget is self.path_editor:
+            self.path_editor = None
+
     def _setup_console_tab(self):
-        tab = ttk.Frame(self.notebook, padding=10)
-        self.notebook.add(tab, text=language_manager.get_text('tab_console'))
+        # Contents are built on first visit (_on_tab_changed); the window opens on shortcuts
+        self._console_tab = ttk.Frame(self.notebook, padding=10)
+        self._console_built = False
+        self.notebook.add(self._console_tab, text=language_manager.get_text('tab_console'))
+
+    def _on_tab_changed(self, event=None):
+        if not self._console_built and self.notebook.select() == str(self._console_tab):
+            self._console_built = True
+            self._build_console_tab()
+
+    def _build_console_tab(self):
+        tab = self._console_tab
         
         # --- Top: Category Selection ---
         top_frame = ttk.Frame(tab)
@@ -107,7 +155,6 @@ class WindowsToolsWindow(tk.Toplevel):
         
         ttk.Label(top_frame, text="Category:").pack(side=tk.LEFT, padx=(0, 5))
         
-        from core.command_library import COMMAND_CATEGORIES
         self.categories = list(COMMAND_CATEGORIES.keys())
         
         self.cat_var = tk.StringVar()
@@ -139,7 +186,7 @@ class WindowsToolsWindow(tk.Toplevel):
         sb.pack(side=tk.RIGHT, fill=tk.Y)
         
         # Bind double click to run
-        self.cmd_tree.bind("<Double-1>", lambda e: self._run_selected_command())
+        self.cmd_tree.bind("<Double-1>", self._run_selected_command)
 
         # --- Bottom: Controls ---
         ctrl_frame = ttk.Frame(tab)
@@ -154,48 +201,84 @@ class WindowsToolsWindow(tk.Toplevel):
         out_frame = ttk.LabelFrame(tab, text="Console Output", padding=5)
         out_frame.pack(fill=tk.BOTH, expand=True)
         
-        self.output_text = scrolledtext.ScrolledText(out_frame, state='disabled', height=10, font=("Consolas", 9))
-        self.output_text.pack(fill=tk.BOTH, expand=True)
+        # Plain read-only Text: no undo stack, and no line wrapping to recompute
+        # on insert, so long lines scroll horizontally instead
+        self.output_text = tk.Text(out_frame, state='disabled', height=10, font=("Consolas", 9),
+                                   wrap='none', undo=False, maxundo=0, autoseparators=False)
         self.output_text.config(bg="black", fg="#00FF00", insertbackground="white") # Matrix style green
+        out_vsb = ttk.Scrollbar(out_frame, orient=tk.VERTICAL, command=self.output_text.yview)
+        out_hsb = ttk.Scrollbar(out_frame, orient=tk.HORIZONTAL, command=self.output_text.xview)
+        self.output_text.configure(yscrollcommand=out_vsb.set, xscrollcommand=out_hsb.set)
         
-        # Init list
-        self._on_category_change(None)
+        self.output_text.grid(row=0, column=0, sticky='nsew')
+        out_vsb.grid(row=0, column=1, sticky='ns')
+        out_hsb.grid(row=1, column=0, sticky='ew')
+        out_frame.rowconfigure(0, weight=1)
+        out_frame.columnconfigure(0, weight=1)
+        
+        # Init list once the tab has been drawn
+        self.after_idle(self._on_category_change, None)
+        # Only the console shows command output; poll for it from here on
+        self._poll_after_id = self.after(self.OUTPUT_FLUSH_MS, self._poll_output)
 
     def _on_category_change(self, event):
-        # Clear tree
-        for item in self.cmd_tree.get_children():
-            self.cmd_tree.delete(item)
+        # Clear tree in one call; skipped on the first fill, when it is empty
+        children = self.cmd_tree.get_children()
+        if children:
+            self.cmd_tree.delete(*children)
             
-        cat = self.cat_var.get()
-        from core.command_library import COMMAND_CATEGORIES
-        cmds = COMMAND_CATEGORIES.get(cat, [])
-        
-        current_lang = language_manager.get_current_language()
+        rows = _category_rows(self.cat_var.get(), language_manager.get_current_language())
         
-        for c in cmds:
-            desc = c.get('desc_tr') if current_lang == 'tr' and 'desc_tr' in c else c.get('desc', '')
-            self.cmd_tree.insert('', 'end', values=(c.get('name', ''), c.get('cmd', ''), desc))
+        # Tk redraws once at idle, after the whole batch is in
+        insert = self.cmd_tree.insert
+        for values in rows:
+            insert('', 'end', values=values)
 
-    def _run_selected_command(self):
+    def _run_selected_command(self, event=None):
         sel = self.cmd_tree.selection()
         if not sel: return
         
         vals = self.cmd_tree.item(sel[0], 'values')
         cmd = vals[1] # Command is 2nd column
         
-        self._append_output(f"\n> {cmd}\n")
+        self._queue_output(f"\n> {cmd}\n")
         self.run_btn.config(state='disabled')
         
         # Run in thread
         threading.Thread(target=self._execute_thread, args=(cmd,), daemon=True).start()
 
     def _execute_thread(self, cmd):
-        WindowsUtils.run_command_live(cmd, lambda line: self.after(0, self._append_output, line))
-        self.after(0, lambda: self.run_btn.config(state='normal'))
+        WindowsUtils.run_command_live(cmd, self._queue_output)
+        self._out_q.put(_RUN_DONE)  # _poll_output re-enables the Run button
+
+    def _queue_output(self, text):
+        # Safe from any thread; no Tk call is made here
+        self._out_q.put(text)
+
+    def _poll_output(self):
+        chunks = []
+        run_done = False
+        try:
+            while True:
+                item = self._out_q.get_nowait()
+                if item is _RUN_DONE:
+                    run_done = True
+                else:
+                    chunks.append(item)
+        except queue.Empty:
+            pass
+        if chunks:
+            self._append_output(''.join(chunks))
+        if run_done:
+            self.run_btn.config(state='normal')
+        self._poll_after_id = self.after(self.OUTPUT_FLUSH_MS, self._poll_output)
 
     def _append_output(self, text):
         self.output_text.config(state='normal')
         self.output_text.insert(tk.END, text)
+        lines = int(self.output_text.index('end-1c').split('.')[0])
+        if lines > self.MAX_OUTPUT_LINES:
+            self.output_text.delete('1.0', f'{lines - self.MAX_OUTPUT_LINES + 1}.0')
         self.output_text.see(tk.END)
         self.output_text.config(state='disabled')
 
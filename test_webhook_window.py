@@ -1,9 +1,10 @@
 """Tests for the webhook settings window functionality."""
 
+import time
 import tkinter as tk
+from contextlib import contextmanager
 
 from gui.main_window import SystemMonitorGUI
-import requests
 import traceback
 from tkinter import messagebox
 
@@ -12,6 +13,20 @@ class _Resp:
         self.status_code = code
 
 
+_OK = _Resp(200)
+
+
+@contextmanager
+def _patched_post(notifier):
+    """Stub the notifier session's post with an always-200 response to avoid network."""
+    notifier.session.post = lambda url, json=None, timeout=10: _OK
+    try:
+        yield
+    finally:
+        # Drop the instance attribute so requests.Session.post is used again
+        del notifier.session.post
+
+
 def test_webhook_window_open_and_add():
     root = tk.Tk()
     root.withdraw()
@@ -40,13 +55,9 @@ def test_webhook_window_open_and_add():
         win.url_var.set("https://example.com/webhook")
         win.type_var.set("network")
         win._on_type_change()
-        # Patch requests.post to avoid network
-        orig_post = requests.post
-        requests.post = lambda url, json=None, timeout=10: _Resp(200)
-        try:
+        # Patch the notifier's HTTP session to avoid network
+        with _patched_post(win.webhook_notifier):
             win.add_webhook()
-        finally:
-            requests.post = orig_post
 
         root.update()
         new_count = len(win.tree.get_children())
@@ -63,12 +74,8 @@ def test_webhook_window_open_and_add():
         # Edit URL
         win.url_var.set("https://example.com/updated")
         # Save edit (update)
-        orig_post = requests.post
-        requests.post = lambda url, json=None, timeout=10: _Resp(200)
-        try:
+        with _patched_post(win.webhook_notifier):
             win.update_webhook()
-        finally:
-            requests.post = orig_post
         # Verify updated in tree (re-find row by name)
         for iid in win.tree.get_children():
             vals = win.tree.item(iid, "values")
@@ -81,15 +88,20 @@ def test_webhook_window_open_and_add():
 
         # Test send test message
         win.tree.selection_set(first_item)
-        orig_post = requests.post
-        requests.post = lambda url, json=None, timeout=10: _Resp(200)
         # Monkeypatch messagebox to avoid blocking
         orig_mb = messagebox.showinfo
         messagebox.showinfo = lambda *a, **kw: None
         try:
-            win.test_selected()
+            with _patched_post(win.webhook_notifier):
+                win.test_selected()
+                # Sends run on a worker thread; keep the patches in place until
+                # _on_tests_sent has run on the Tk thread and re-enabled the button
+                deadline = time.monotonic() + 5
+                while str(win.test_btn['state']).lower() != 'normal':
+                    assert time.monotonic() < deadline, "Test sends did not finish"
+                    root.update()
+                    time.sleep(0.01)
         finally:
-            requests.post = orig_post
             messagebox.showinfo = orig_mb
 
         # Cancel edit mode and verify return to Add mode
@@ -6,27 +6,100 @@ Provides logging capabilities with file rotation and GUI integration.
 
 import os
 import time
+import atexit
 import threading
+import queue
+from collections import deque
 from datetime import datetime
 from tkinter import scrolledtext, filedialog, messagebox
 
 from core.language import language_manager
 
 
+# (epoch second, formatted timestamp) of the last log line; swapped as one
+# tuple so threads never see a second paired with another second's string
+_ts_cache = (0, "")
+
+
+def _timestamp() -> str:
+    """Return the current local time as text, formatting once per second."""
+    global _ts_cache
+    now = int(time.time())
+    if now != _ts_cache[0]:
+        _ts_cache = (now, time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now)))
+    return _ts_cache[1]
+
+
+# Log tag -> foreground color
+LOG_TAG_COLORS = {"error": "red", "success": "green", "normal": "black"}
+
+
+def _setup_log_tags(widget):
+    """Configure the log color tags on a Text widget once."""
+    if getattr(widget, "_rc_tags_set", False):
+        return
+    for tag, color in LOG_TAG_COLORS.items():
+        widget.tag_configure(tag, foreground=color)
+    widget._rc_tags_set = True
+
+
 class FileManager:
     """File operations utility class."""
 
+    # Directories already created or found; saves run every minute and would
+    # otherwise stat the same "logs" directory forever
+    _known_dirs = set()
+
     @staticmethod
     def ensure_directory_exists(directory: str):
         """Create directory if it doesn't exist."""
-        if not os.path.exists(directory):
-            os.makedirs(directory)
+        if directory in FileManager._known_dirs:
+            return
+        os.makedirs(directory, exist_ok=True)
+        FileManager._known_dirs.add(directory)
+
+    @staticmethod
+    def _forget_directory(filepath: str):
+        """Drop filepath's directory from the cache after it turned out to be missing."""
+        FileManager._known_dirs.discard(os.path.dirname(filepath) or '.')
 
     @staticmethod
     def save_to_file(content: str, filepath: str, encoding: str = 'utf-8'):
-        """Save content to file."""
-        with open(filepath, 'w', encoding=encoding) as f:
-            f.write(content)
+        """Save content to file with one encode and unbuffered writes."""
+        # Same line endings as a text-mode write on this platform
+        if os.linesep != '\n':
+            content = content.replace('\n', os.linesep)
+        data = memoryview(content.encode(encoding))
+        try:
+            fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+        except FileNotFoundError:
+            # Directory was removed while running; let the next save recreate it
+            FileManager._forget_directory(filepath)
+            raise
+        try:
+            while data:
+                data = data[os.write(fd, data):]
+        finally:
+            os.close(fd)
+
+    @staticmethod
+    def stream_widget_to_file(widget, filepath: str, header: str = "",
+                              chunk_lines: int = 1000, encoding: str = 'utf-8'):
+        """Save a Text widget's contents after header, chunk_lines lines at a time."""
+        try:
+            f = open(filepath, 'w', encoding=encoding)
+        except FileNotFoundError:
+            FileManager._forget_directory(filepath)
+            raise
+        with f:
+            f.write(header)
+            line = 1
+            while True:
+                chunk = widget.get(f"{line}.0", f"{line + chunk_lines}.0")
+                if not chunk:
+                    break
+                f.write(chunk)
+                line += chunk_lines
 
     @staticmethod
     def export_log_dialog(content: str, title: str = "Save Log File"):
@@ -47,8 +120,14 @@ class FileManager:
         return None
 
 
-class Logger:
-    """Logger class for system log operations."""
+class _BaseLogger:
+    """Shared widget and rotating file logging for the system and network logs."""
+
+    # First token of each rotated file's header
+    HEADER_PREFIX = "==== LOG FILE START ===="
+    # Messages logged with a level below this skip the widget and only reach
+    # the log file; with file logging off they return before any formatting
+    LEVEL = 0
 
     def __init__(self, text_widget: scrolledtext.ScrolledText):
         self.text_widget = text_widget
@@ -59,19 +138,42 @@ class Logger:
         self.current_file_path = None
         self.file_index = 0
         self.max_size_bytes = 500 * 1024  # 500KB limit
+        self.max_lines = 2000  # Scrollback kept in the widget
+        self._pending = []  # (text, tag, text, tag, ...) awaiting the idle flush
+        self._lines = deque(maxlen=self.max_lines)  # Mirror of the widget text for export
+        # File writes are buffered here and written by a background flush thread
+        self._buf = bytearray()
+        self._buf_lock = threading.Lock()
+        self._file_lock = threading.Lock()
+        self._flush_interval = 0.2  # seconds
+        self._flush_threshold = 16 * 1024  # bytes; wake the flusher early above this
+        self._flush_wake = threading.Event()
+        self._flush_thread = None
+        self._atexit_registered = False
+        self._fh = None  # Current log file, kept open between flushes
+        self._current_bytes = 0  # Bytes written to _fh; replaces a stat per flush
 
     def setup_tags(self):
         """Setup log color tags."""
-        self.text_widget.tag_configure("error", foreground="red")
-        self.text_widget.tag_configure("success", foreground="green")
-        self.text_widget.tag_configure("normal", foreground="black")
+        _setup_log_tags(self.text_widget)
 
-    def log(self, message: str, tag: str = "normal"):
+    def log(self, message: str, tag: str = "normal", level: int = 0):
         """Add log message."""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        log_entry = f"[{timestamp}] {message}\n"
-        self.text_widget.insert('end', log_entry, tag)
-        self.text_widget.see('end')
+        if level < self.LEVEL and not self.file_logging_enabled:
+            return
+        self.log_many([message], tag, level)
+
+    def log_many(self, messages, tag: str = "normal", level: int = 0):
+        """Add several log messages with a single widget insert."""
+        below_level = level < self.LEVEL
+        if not messages or (below_level and not self.file_logging_enabled):
+            return
+        timestamp = _timestamp()
+        lines = [f"[{timestamp}] {message}\n" for message in messages]
+        log_entry = "".join(lines)
+        if not below_level:
+            self._lines.extend(lines)
+            self._insert(log_entry, tag)
         
         # Write to file
         if self.file_logging_enabled:
@@ -81,8 +183,38 @@ class Logger:
                 # Silent error handling to avoid breaking GUI
                 pass
 
+    def _insert(self, text: str, tag: str):
+        """Queue text for the widget; bursts are flushed once when Tk goes idle."""
+        pending = self._pending
+        if not pending:
+            self.text_widget.after_idle(self._flush)
+        elif pending[-1] == tag:
+            # Same tag as the previous entry: extend its run instead of adding one
+            pending[-2] += text
+            return
+        pending.extend((text, tag))
+
+    def _flush(self):
+        """Insert all queued text into the (read-only) widget and trim old lines."""
+        if not self._pending:
+            return
+        chunks, self._pending = self._pending, []
+        self.text_widget.configure(state='normal')
+        self.text_widget.insert('end', *chunks)
+        if int(self.text_widget.index('end-1c').split('.')[0]) > self.max_lines:
+            self.text_widget.delete('1.0', f'end-{self.max_lines}l')
+        self.text_widget.configure(state='disabled')
+        self.text_widget.see('end')
+
+    def get_content(self) -> str:
+        """Return the current log text without reading it back from Tk."""
+        return "".join(self._lines)
+
     def clear(self):
         """Clear logs."""
+        self._pending = []
+        self._lines.clear()
+        self.text_widget.configure(state='normal')
         self.text_widget.delete(1.0, 'end')
         self.log(language_manager.get_text('log_cleared'))
 
@@ -96,183 +228,189 @@ class Logger:
         FileManager.ensure_directory_exists(os.path.dirname(base_path) or '.')
         self.base_path = base_path
         
-        # Find existing files and select highest index
+        # Resume after the highest index: the sidecar written on rotation,
+        # or a directory scan when it is missing (first run, older logs)
+        try:
+            with open(base_path + '.idx', encoding='utf-8') as f:
+                self.file_index = int(f.read())
+        except (OSError, ValueError):
+            self.file_index = self._scan_file_index(base_path)
+        with self._file_lock:
+            self._rotate_file_if_needed(force_new=True)
+        self.file_logging_enabled = True
+        if self._flush_thread is None or not self._flush_thread.is_alive():
+            self._flush_thread = threading.Thread(target=self._flush_loop, daemon=True)
+            self._flush_thread.start()
+        if not self._atexit_registered:
+            atexit.register(self.flush)
+            self._atexit_registered = True
+
+    @staticmethod
+    def _scan_file_index(base_path: str) -> int:
+        """Return the highest index among existing base_path_N.txt files."""
         directory = os.path.dirname(base_path) or '.'
-        prefix = os.path.basename(base_path)
-        existing = []
+        prefix = os.path.basename(base_path) + '_'
+        start = len(prefix)
+        best = 0
         try:
-            for fname in os.listdir(directory):
-                if fname.startswith(prefix + '_') and fname.endswith('.txt'):
-                    try:
-                        idx_part = fname[len(prefix) + 1:-4]
-                        existing.append(int(idx_part))
-                    except ValueError:
-                        pass
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if name.endswith('.txt') and name.startswith(prefix):
+                        try:
+                            index = int(name[start:-4])
+                        except ValueError:
+                            continue
+                        if index > best:
+                            best = index
         except FileNotFoundError:
             pass
-        
-        self.file_index = max(existing) if existing else 0
-        self._rotate_file_if_needed(force_new=True)
-        self.file_logging_enabled = True
+        return best
+
+    def _save_file_index(self):
+        """Record file_index in the base_path.idx sidecar (atomic replace)."""
+        idx_path = self.base_path + '.idx'
+        tmp_path = idx_path + '.tmp'
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(str(self.file_index))
+            os.replace(tmp_path, idx_path)
+        except OSError:
+            pass
 
     def disable_file_logging(self):
         """Disable file logging."""
         self.file_logging_enabled = False
-
-    def _current_size(self) -> int:
-        """Get current log file size."""
-        if self.current_file_path and os.path.exists(self.current_file_path):
-            try:
-                return os.path.getsize(self.current_file_path)
-            except Exception:
-                return 0
-        return 0
+        self._flush_wake.set()
+        if self._flush_thread is not None:
+            self._flush_thread.join()
+            self._flush_thread = None
+        self.flush()
+        with self._file_lock:
+            if self._fh is not None:
+                self._fh.close()
+                self._fh = None
 
     def _rotate_file_if_needed(self, force_new: bool = False):
         """Rotate log file if needed."""
-        if force_new or not self.current_file_path or self._current_size() >= self.max_size_bytes:
+        if force_new or not self.current_file_path or self._current_bytes >= self.max_size_bytes:
             self.file_index += 1
             self.current_file_path = f"{self.base_path}_{self.file_index}.txt"
+            # A stale sidecar must never make us truncate an existing log
+            while os.path.exists(self.current_file_path):
+                self.file_index += 1
+                self.current_file_path = f"{self.base_path}_{self.file_index}.txt"
+            self._save_file_index()
             
             # Add header to new file
             header = (
-                f"==== LOG FILE START ==== {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+                f"{self.HEADER_PREFIX} {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
                 f"Maximum file size: {self.max_size_bytes} bytes (500KB)\n"
                 f"File: {os.path.basename(self.current_file_path)}\n"
                 + "=" * 60 + "\n"
             )
+            if self._fh is not None:
+                self._fh.close()
+                self._fh = None
+            header_bytes = header.encode('utf-8')
+            self._current_bytes = len(header_bytes)
             try:
-                with open(self.current_file_path, 'w', encoding='utf-8') as f:
-                    f.write(header)
+                self._fh = open(self.current_file_path, 'wb')
+                self._fh.write(header_bytes)
+                self._fh.flush()
             except Exception:
                 pass
 
     def _write_to_file(self, log_entry: str):
-        """Write log entry to file."""
+        """Queue log entry for the background flush thread."""
         if not self.file_logging_enabled or not self.base_path:
             return
-            
-        # Rotation check (before writing new entry)
-        if not self.current_file_path or self._current_size() >= self.max_size_bytes:
-            self._rotate_file_if_needed(force_new=True)
         
-        try:
-            with open(self.current_file_path, 'a', encoding='utf-8') as f:
-                f.write(log_entry)
-        except Exception:
-            pass
-
-
-class NetworkLogger:
-    """Network logger class for network log operations."""
-
-    def __init__(self, text_widget: scrolledtext.ScrolledText):
-        self.text_widget = text_widget
-        self.setup_tags()
-        self.file_logging_enabled = False
-        self.base_path = None
-        self.current_file_path = None
-        self.file_index = 0
-        self.max_size_bytes = 500 * 1024
-
-    def setup_tags(self):
-        """Setup network log color tags."""
-        self.text_widget.tag_configure("error", foreground="red")
-        self.text_widget.tag_configure("success", foreground="green")
-        self.text_widget.tag_configure("normal", foreground="black")
-
-    def log(self, message: str, tag: str = "normal"):
-        """Add network log message."""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        log_entry = f"[{timestamp}] {message}\n"
-        self.text_widget.insert('end', log_entry, tag)
-        self.text_widget.see('end')
-        
-        if self.file_logging_enabled:
+        with self._buf_lock:
+            self._buf.extend(log_entry.encode('utf-8'))
+            if len(self._buf) >= self._flush_threshold:
+                self._flush_wake.set()
+
+    def _flush_loop(self):
+        """Flush buffered entries every _flush_interval until file logging is disabled."""
+        while self.file_logging_enabled:
+            self._flush_wake.wait(self._flush_interval)
+            self._flush_wake.clear()
+            self.flush()
+
+    def flush(self):
+        """Write all buffered log entries to the current log file."""
+        with self._file_lock:
+            with self._buf_lock:
+                if not self._buf:
+                    return
+                buf, self._buf = self._buf, bytearray()
+            
+            if not self.current_file_path:
+                self._rotate_file_if_needed(force_new=True)
+            
+            # Fill the current file up to the last whole line that fits, rotate,
+            # and continue with the rest, so files stay within max_size_bytes
+            data = memoryview(buf)
+            start, end = 0, len(buf)
+            fresh = False  # True right after a rotation made for this batch
+            while start < end:
+                room = self.max_size_bytes - self._current_bytes
+                stop = end
+                if end - start > room:
+                    stop = buf.rfind(b'\n', start, start + max(room, 0)) + 1
+                    if stop <= start:
+                        if not fresh:
+                            self._rotate_file_if_needed(force_new=True)
+                            fresh = True
+                            continue
+                        # A single line larger than a whole file goes in as is
+                        stop = buf.find(b'\n', start) + 1 or end
+                if self._fh is None:
+                    return
+                try:
+                    self._fh.write(data[start:stop])
+                except Exception:
+                    return
+                self._current_bytes += stop - start
+                start = stop
+                fresh = False
+                if start < end:
+                    self._rotate_file_if_needed(force_new=True)
+                    fresh = True
+            
             try:
-                self._write_to_file(log_entry)
+                self._fh.flush()
             except Exception:
                 pass
 
-    def clear(self):
-        """Clear network logs."""
-        self.text_widget.delete(1.0, 'end')
-        self.log(language_manager.get_text('log_cleared'))
-
-    def enable_file_logging(self, base_path: str):
-        """Enable file logging for network logs."""
-        FileManager.ensure_directory_exists(os.path.dirname(base_path) or '.')
-        self.base_path = base_path
-        directory = os.path.dirname(base_path) or '.'
-        prefix = os.path.basename(base_path)
-        existing = []
-        try:
-            for fname in os.listdir(directory):
-                if fname.startswith(prefix + '_') and fname.endswith('.txt'):
-                    try:
-                        idx_part = fname[len(prefix) + 1:-4]
-                        existing.append(int(idx_part))
-                    except ValueError:
-                        pass
-        except FileNotFoundError:
-            pass
-        
-        self.file_index = max(existing) if existing else 0
-        self._rotate_file_if_needed(force_new=True)
-        self.file_logging_enabled = True
+class Logger(_BaseLogger):
+    """Logger class for system log operations."""
 
-    def disable_file_logging(self):
-        """Disable file logging."""
-        self.file_logging_enabled = False
 
-    def _current_size(self) -> int:
-        """Get current log file size."""
-        if self.current_file_path and os.path.exists(self.current_file_path):
-            try:
-                return os.path.getsize(self.current_file_path)
-            except Exception:
-                return 0
-        return 0
-
-    def _rotate_file_if_needed(self, force_new: bool = False):
-        """Rotate log file if needed."""
-        if force_new or not self.current_file_path or self._current_size() >= self.max_size_bytes:
-            self.file_index += 1
-            self.current_file_path = f"{self.base_path}_{self.file_index}.txt"
-            header = (
-                f"==== NETWORK LOG FILE START ==== {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
-                f"Maximum file size: {self.max_size_bytes} bytes (500KB)\n"
-                f"File: {os.path.basename(self.current_file_path)}\n"
-                + "=" * 60 + "\n"
-            )
-            try:
-                with open(self.current_file_path, 'w', encoding='utf-8') as f:
-                    f.write(header)
-            except Exception:
-                pass
+class NetworkLogger(_BaseLogger):
+    """Network logger class for network log operations."""
 
-    def _write_to_file(self, log_entry: str):
-        """Write log entry to file."""
-        if not self.file_logging_enabled or not self.base_path:
-            return
-        if not self.current_file_path or self._current_size() >= self.max_size_bytes:
-            self._rotate_file_if_needed(force_new=True)
-        try:
-            with open(self.current_file_path, 'a', encoding='utf-8') as f:
-                f.write(log_entry)
-        except Exception:
-            pass
+    HEADER_PREFIX = "==== NETWORK LOG FILE START ===="
 
 
 class AutoLogger:
     """Automatic log saving class."""
 
-    def __init__(self, system_text_widget, network_text_widget):
+    ERROR_PRINT_INTERVAL = 60  # seconds
+
+    def __init__(self, system_text_widget, network_text_widget, post_to_gui):
         self.system_text_widget = system_text_widget
         self.network_text_widget = network_text_widget
+        self.post_to_gui = post_to_gui  # Runs a callback on the Tk thread; safe from any thread
         self.enabled = False
-        self.system_thread = None
-        self.network_thread = None
+        self._thread = None
+        self._stop_event = None
+        self._snapshots = None
+        # Recent save failures as (time, message); printing is throttled so a
+        # persistent failure (disk full, no permission) cannot flood stdout
+        self.recent_errors = deque(maxlen=64)
+        self._last_error_print = 0.0
         self.current_system_start_time = None
         self.current_network_start_time = None
 
@@ -283,33 +421,44 @@ class AutoLogger:
             self.current_system_start_time = datetime.now()
             self.current_network_start_time = datetime.now()
 
-            # System log thread
-            self.system_thread = threading.Thread(target=self._system_log_worker, daemon=True)
-            self.system_thread.start()
-
-            # Network log thread
-            self.network_thread = threading.Thread(target=self._network_log_worker, daemon=True)
-            self.network_thread.start()
+            # One thread saves both logs; a fresh event and queue per run let
+            # stop() wake it at once without touching a later run
+            self._stop_event = threading.Event()
+            self._snapshots = queue.Queue()
+            self._thread = threading.Thread(
+                target=self._log_worker, args=(self._stop_event, self._snapshots), daemon=True
+            )
+            self._thread.start()
 
     def stop(self):
         """Stop automatic log saving."""
         self.enabled = False
+        if self._stop_event is not None:
+            self._stop_event.set()
+            self._snapshots.put(None)  # Release a worker waiting for a snapshot
+
+    def _log_worker(self, stop_event, snapshots):
+        """Every minute, snapshot both logs on the Tk thread and save them here."""
+        while not stop_event.wait(60):  # Wait 1 minutes
+            # Tk widgets may only be read on the Tk thread; the disk writes stay here
+            self.post_to_gui(self._take_snapshots, snapshots)
+            contents = snapshots.get()
+            if contents is None:
+                break
+            system_content, network_content = contents
+            self._save_system_log(system_content)
+            self._save_network_log(network_content)
+
+    def _take_snapshots(self, snapshots):
+        """Copy both log widgets for the worker (runs on the Tk thread)."""
+        # One get per widget: the widgets hold at most max_lines lines each
+        try:
+            contents = (self.system_text_widget.get(1.0, 'end'), self.network_text_widget.get(1.0, 'end'))
+        except Exception:
+            contents = None  # Widgets are gone (application closing)
+        snapshots.put(contents)
 
-    def _system_log_worker(self):
-        """System log worker thread."""
-        while self.enabled:
-            time.sleep(60)  # Wait 1 minutes
-            if self.enabled:
-                self._save_system_log()
-
-    def _network_log_worker(self):
-        """Network log worker thread."""
-        while self.enabled:
-            time.sleep(60)  # Wait 1 minutes
-            if self.enabled:
-                self._save_network_log()
-
-    def _save_system_log(self):
+    def _save_system_log(self, log_content: str):
         """Save system log."""
         try:
             FileManager.ensure_directory_exists("logs")
@@ -317,16 +466,15 @@ class AutoLogger:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"logs/system_log_{timestamp}.txt"
 
-            log_content = self.system_text_widget.get(1.0, 'end')
             header = f"System Monitor Log - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
             header += "=" * 80 + "\n"
 
             FileManager.save_to_file(header + log_content, filename)
 
         except Exception as e:
-            print(f"Auto system log save error: {str(e)}")
+            self._report_error(f"Auto system log save error: {str(e)}")
 
-    def _save_network_log(self):
+    def _save_network_log(self, log_content: str):
         """Save network log."""
         try:
             FileManager.ensure_directory_exists("logs")
@@ -334,14 +482,21 @@ class AutoLogger:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"logs/network_log_{timestamp}.txt"
 
-            log_content = self.network_text_widget.get(1.0, 'end')
             header = f"Network Monitor Log - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
             header += "=" * 80 + "\n"
 
             FileManager.save_to_file(header + log_content, filename)
 
         except Exception as e:
-            print(f"Auto network log save error: {str(e)}")
+            self._report_error(f"Auto network log save error: {str(e)}")
+
+    def _report_error(self, message: str):
+        """Record a save error; print at most one per ERROR_PRINT_INTERVAL seconds."""
+        now = time.time()
+        self.recent_errors.append((now, message))
+        if now - self._last_error_print >= self.ERROR_PRINT_INTERVAL:
+            self._last_error_print = now
+            print(message)
 
     def save_hourly_logs(self):
         """Save hourly logs."""
@@ -352,26 +507,26 @@ class AutoLogger:
                 # System hourly log
                 system_timestamp = self.current_system_start_time.strftime("%Y%m%d_%H%M%S")
                 system_filename = f"logs/hourly_system_log_{system_timestamp}.txt"
-                system_content = self.system_text_widget.get(1.0, 'end')
                 system_header = f"Hourly System Log - {self.current_system_start_time.strftime('%Y-%m-%d %H:%M:%S')} - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
                 system_header += "=" * 80 + "\n"
-                FileManager.save_to_file(system_header + system_content, system_filename)
+                FileManager.stream_widget_to_file(self.system_text_widget, system_filename, system_header)
 
                 # Network hourly log
                 network_timestamp = self.current_network_start_time.strftime("%Y%m%d_%H%M%S")
                 network_filename = f"logs/hourly_network_log_{network_timestamp}.txt"
-                network_content = self.network_text_widget.get(1.0, 'end')
                 network_header = f"Hourly Network Log - {self.current_network_start_time.strftime('%Y-%m-%d %H:%M:%S')} - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
                 network_header += "=" * 80 + "\n"
-                FileManager.save_to_file(network_header + network_content, network_filename)
+                FileManager.stream_widget_to_file(self.network_text_widget, network_filename, network_header)
 
                 # Start new period
                 self.current_system_start_time = datetime.now()
                 self.current_network_start_time = datetime.now()
 
-                # Clear logs
-                self.system_text_widget.delete(1.0, 'end')
-                self.network_text_widget.delete(1.0, 'end')
+                # Clear logs (widgets are kept read-only between writes)
+                for widget in (self.system_text_widget, self.network_text_widget):
+                    widget.configure(state='normal')
+                    widget.delete(1.0, 'end')
+                    widget.configure(state='disabled')
 
             except Exception as e:
-                print(f"Hourly log save error: {str(e)}")
\ No newline at end of file
+                self._report_error(f"Hourly log save error: {str(e)}")
\ No newline at end of file